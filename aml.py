@@ -2,8 +2,10 @@
 
 import sys
 import os
+import json
 import time
 import datetime
+import threading
 from aml.aml_runtime import AMLRuntime
 import aml_runtime_access
 
@@ -17,6 +19,7 @@ def print_help():
     print("  -i, --interactive  Run in interactive mode")
     print("  --yield-every N    Micro-yield after N statements/evaluations (default 64)")
     print("  --yield-sleep-ms MS  Sleep MS milliseconds per yield (default 0)")
+    print("  --serve        Read script paths from stdin, run each, stream JSON results")
     print("")
     print("If no script is provided, AML will run in interactive mode.")
 
@@ -56,6 +59,91 @@ def run_file(file_path, yield_every=None, yield_sleep_ms=None):
         print(f"Error: {e}")
         sys.exit(1)
 
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def _forward_lines(fd, key, send, token, done):
+    """Forward every line written to fd as a JSON message {key: line}; a line ending in token marks the end of a script."""
+    with os.fdopen(fd, 'rb') as pipe:
+        for raw in pipe:
+            line = raw.decode('utf-8', errors='replace').rstrip("\r\n")
+            if line.endswith(token):
+                line = line[:-len(token)]
+                if line:
+                    send({key: line})
+                done.set()
+            else:
+                send({key: line})
+
+def _drop_project_modules(before):
+    # Modules from this tree imported by a script (plugins etc.) are re-imported fresh by the next one
+    for name in list(sys.modules):
+        if name in before:
+            continue
+        path = getattr(sys.modules[name], '__file__', None) or ''
+        if path.endswith('.py') and os.path.abspath(path).startswith(_ROOT):
+            del sys.modules[name]
+
+def serve(yield_every=None, yield_sleep_ms=None):
+    """Worker mode for the test runner: one script path per stdin line.
+
+    Replies go to a private duplicate of the original stdout. fd 1/2 are
+    re-pointed at pipes, so anything a script (or a child process) writes is
+    streamed as one JSON message per line ({"out": ...} / {"err": ...}) and can
+    never be mistaken for a reply. Every script ends with {"returncode": N}.
+
+    Scripts share one Python process: project modules they import are dropped
+    after each script, but other process-wide state (threads, C extensions)
+    persists. tests/run_tests.py --isolated runs each script in a fresh worker.
+    """
+    requests = os.fdopen(os.dup(0), 'r')
+    replies = os.fdopen(os.dup(1), 'w')
+    lock = threading.Lock()
+
+    def send(msg):
+        with lock:
+            replies.write(json.dumps(msg) + "\n")
+            replies.flush()
+
+    # Scripts read an empty stdin and write into the capture pipes
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    token = f"\x00aml-serve-{os.getpid()}-end"
+    events = []
+    for fd, key in ((1, "out"), (2, "err")):
+        r, w = os.pipe()
+        os.dup2(w, fd)
+        os.close(w)
+        done = threading.Event()
+        events.append((fd, done))
+        threading.Thread(target=_forward_lines, args=(r, key, send, token, done), daemon=True).start()
+    sys.stdout.reconfigure(line_buffering=True)
+    sys.stderr.reconfigure(line_buffering=True)
+
+    for line in requests:
+        path = line.strip()
+        if not path:
+            continue
+        returncode = 0
+        before = set(sys.modules)
+        try:
+            run_file(path, yield_every=yield_every, yield_sleep_ms=yield_sleep_ms)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            returncode = 1
+        _drop_project_modules(before)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Wait until both pipes have been drained up to this point
+        for fd, done in events:
+            done.clear()
+            os.write(fd, (token + "\n").encode())
+        for fd, done in events:
+            done.wait()
+        send({"returncode": returncode})
+
 def run_interactive(yield_every=None, yield_sleep_ms=None):
     print("AML Interactive Mode (Ctrl+C to exit)")
     print("Type your AML code and press Enter to execute")
@@ -136,7 +224,10 @@ def main():
         except Exception:
             pass
     
-    if not args or '-i' in args or '--interactive' in args:
+    if '--serve' in args:
+        # Persistent worker (used by tests/run_tests.py)
+        serve(yield_every=yield_every, yield_sleep_ms=yield_sleep_ms)
+    elif not args or '-i' in args or '--interactive' in args:
         # Interactive mode
         run_interactive(yield_every=yield_every, yield_sleep_ms=yield_sleep_ms)
     elif '-h' in args or '--help' in args:
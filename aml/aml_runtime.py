@@ -16,7 +16,7 @@ import threading
 import types
 
 from .lexer import Lexer
-from .parser import Parser, ImportPy, ImportAml
+from .parser import Parser, Program, ImportPy, ImportAml
 from .interpreter import Interpreter, Function, Namespace, TaskHandle
 
 
@@ -125,20 +125,25 @@ class AMLRuntime:
         return (self._started and not self.interpreter.cancelled) or t_alive
 
     # --------- Виконання AML ---------
-    def run_source(self, source: str) -> None:
-        """Виконує AML-код із рядка у поточному середовищі."""
+    def compile_source(self, source: str) -> Program:
+        """Лексує та парсить AML-код із рядка без виконання.
+        Результат можна виконувати багато разів через run_program().
+        """
         with self._lock:
             lexer = Lexer(source)
             tokens = lexer.tokenize()
             parser = Parser(tokens)
-            program = parser.parse()
+            return parser.parse()
 
+    def run_program(self, program: Program, source: str = "", file_path: str = '<string>') -> None:
+        """Виконує попередньо скомпільований AST у поточному середовищі."""
+        with self._lock:
             self.interpreter.reset_cancel()
         # Інтерпретуємо поза замком, щоб stop() міг працювати
         try:
             try:
-                self.interpreter.push_file_context('<string>', source)
-                self.interpreter.interpret(program, source_text=source, file_path='<string>')
+                self.interpreter.push_file_context(file_path, source)
+                self.interpreter.interpret(program, source_text=source, file_path=file_path)
             finally:
                 self.interpreter.pop_file_context()
             # Оновлюємо кеш метаданих після виконання верхнього рівня
@@ -152,6 +157,11 @@ class AMLRuntime:
                 self.interpreter.cancel()
             print("\nВиконання AML перервано користувачем (KeyboardInterrupt)")
 
+    def run_source(self, source: str) -> None:
+        """Виконує AML-код із рядка у поточному середовищі."""
+        program = self.compile_source(source)
+        self.run_program(program, source)
+
     def run_file(self, file_path: str) -> None:
         """Зчитує та виконує AML-файл або зкомпільований .caml."""
         with self._lock:
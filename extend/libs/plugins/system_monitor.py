@@ -14,8 +14,10 @@ CPU, пам'ять, диск, мережу, процеси та сервіси W
 """
 
 import psutil
+import atexit
 import json
 import time
+import threading
 from typing import Optional, List, Dict, Any, Callable
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -86,6 +88,59 @@ class ProcessInfo:
         return f"{self.name} (PID: {self.pid}) | CPU: {self.cpu_percent}% | RAM: {self.memory_percent}%"
 
 
+class _CpuSampler(threading.Thread):
+    """Фоновий збирач завантаження CPU
+
+    psutil.cpu_percent(interval=1) блокує потік на секунду, тому вимір
+    виконується тут, а останній знімок лежить в атрибуті snapshot.
+    Один збирач на процес спільний для всіх SystemMonitor.
+    """
+    
+    def __init__(self, interval: float = 1.0):
+        super().__init__(name='CpuSampler', daemon=True)
+        self.interval = interval
+        # (percent, percent_per_core, monotonic); None, поки перший вимір не готовий
+        self.snapshot: Optional[tuple] = None
+        self._stop_event = threading.Event()
+    
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            per_core = psutil.cpu_percent(interval=self.interval, percpu=True)
+            overall = sum(per_core) / len(per_core) if per_core else 0.0
+            # Присвоєння атомарне: читачі бачать або старий, або новий знімок
+            self.snapshot = (round(overall, 1), per_core, time.monotonic())
+    
+    def stop(self) -> None:
+        """Зупинити збирач"""
+        self._stop_event.set()
+
+
+_cpu_sampler: Optional[_CpuSampler] = None
+_cpu_sampler_lock = threading.Lock()
+
+
+def _get_cpu_sampler() -> _CpuSampler:
+    """Спільний збирач CPU, запускається при першому SystemMonitor"""
+    global _cpu_sampler
+    with _cpu_sampler_lock:
+        if _cpu_sampler is None:
+            _cpu_sampler = _CpuSampler()
+            _cpu_sampler.start()
+        return _cpu_sampler
+
+
+def _stop_cpu_sampler() -> None:
+    """Зупинити спільний збирач (при виході з процесу)"""
+    global _cpu_sampler
+    with _cpu_sampler_lock:
+        sampler, _cpu_sampler = _cpu_sampler, None
+    if sampler is not None:
+        sampler.stop()
+
+
+atexit.register(_stop_cpu_sampler)
+
+
 class SystemMonitor:
     """Монітор системних ресурсів"""
     
@@ -104,6 +159,11 @@ class SystemMonitor:
         }
         self.metrics_history: List[SystemMetrics] = []
         self.alerts: List[Dict[str, Any]] = []
+        
+        # Перший виклик з interval=None лише задає базову точку відліку
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._cpu_sampler = _get_cpu_sampler()
     
     # ============================================================================
     # ОСНОВНІ МЕТРИКИ
@@ -116,12 +176,20 @@ class SystemMonitor:
         Returns:
             Dict: Інформація про CPU
         """
+        snapshot = self._cpu_sampler.snapshot
+        if snapshot:
+            percent, percent_per_core, _ = snapshot
+        else:
+            # Фоновий вимір ще не готовий - неблокуюче значення з моменту prime
+            percent = psutil.cpu_percent(interval=None)
+            percent_per_core = psutil.cpu_percent(interval=None, percpu=True)
+        
         freq = psutil.cpu_freq()
         return {
             'count_physical': psutil.cpu_count(logical=False),
             'count_logical': psutil.cpu_count(logical=True),
-            'percent': psutil.cpu_percent(interval=1),
-            'percent_per_core': psutil.cpu_percent(interval=1, percpu=True),
+            'percent': percent,
+            'percent_per_core': percent_per_core,
             'frequency_current': freq.current if freq else None,
             'frequency_min': freq.min if freq else None,
             'frequency_max': freq.max if freq else None
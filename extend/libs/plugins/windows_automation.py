@@ -14,14 +14,39 @@ Windows Automation модуль - Автоматизація Windows опера
 """
 
 import subprocess
+import asyncio
 import json
+import logging
 import winreg
 import os
-from typing import Optional, List, Dict, Any, Callable
+import ctypes
+from ctypes import wintypes
+import threading
+import time
+import copy
+import uuid
+from functools import wraps
+from typing import Optional, List, Dict, Any, Callable, Tuple, Iterator
 from dataclasses import dataclass, asdict
 from enum import Enum
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Помилки запуску PowerShell та розбору його JSON виводу
+_PS_ERRORS = (subprocess.SubprocessError, OSError, json.JSONDecodeError)
+
+try:
+    import win32service
+except ImportError:
+    win32service = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 
 class ServiceStatus(Enum):
     """Статуси сервісу"""
@@ -30,14 +55,284 @@ class ServiceStatus(Enum):
     PAUSED = "Paused"
 
 
+_STATUS_BY_STR = {s.value: s for s in ServiceStatus}
+
+
+# Без профілю користувача та інтерактивних запитів холодний старт значно швидший
+_PS_ARGV = ['powershell', '-NoProfile', '-NonInteractive', '-ExecutionPolicy', 'Bypass', '-Command']
+
+_HKEY_MAP = {
+    'HKEY_LOCAL_MACHINE': winreg.HKEY_LOCAL_MACHINE,
+    'HKEY_CURRENT_USER': winreg.HKEY_CURRENT_USER,
+    'HKEY_CLASSES_ROOT': winreg.HKEY_CLASSES_ROOT,
+    'HKEY_USERS': winreg.HKEY_USERS,
+    'HKEY_CURRENT_CONFIG': winreg.HKEY_CURRENT_CONFIG,
+}
+
+_REG_TYPE_MAP = {
+    'String': winreg.REG_SZ,
+    'DWORD': winreg.REG_DWORD,
+    'Binary': winreg.REG_BINARY,
+    'ExpandString': winreg.REG_EXPAND_SZ,
+    'MultiString': winreg.REG_MULTI_SZ,
+}
+
+
+def _parse_reg_path(path: str) -> Tuple[Optional[int], str]:
+    """Розібрати шлях реєстру на (hkey, subkey)"""
+    root, _, subkey = path.partition('\\')
+    return _HKEY_MAP.get(root), subkey
+
+
+def _ttl_cache(ttl: float) -> Callable:
+    """
+    Кешувати результат функції на ttl секунд
+    
+    Ключ кешу - аргументи виклику. Обгортка отримує метод cache_clear()
+    для примусового скидання. Кожен виклик отримує власну копію результату,
+    тож зміни на місці (sort, фільтрація) не псують кеш для інших.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Any, Tuple[float, Any]] = {}
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now - hit[0] < ttl:
+                return copy.deepcopy(hit[1])
+            result = func(*args, **kwargs)
+            cache[key] = (now, copy.deepcopy(result))
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+# Стани сервісу з Service Control Manager у термінах Get-Service
+_SERVICE_STATE_NAMES = {
+    1: 'Stopped',
+    2: 'StartPending',
+    3: 'StopPending',
+    4: 'Running',
+    5: 'ContinuePending',
+    6: 'PausePending',
+    7: 'Paused',
+}
+
+
+_WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+
+class _MEMORYSTATUSEX(ctypes.Structure):
+    _fields_ = [
+        ('dwLength', wintypes.DWORD),
+        ('dwMemoryLoad', wintypes.DWORD),
+        ('ullTotalPhys', ctypes.c_ulonglong),
+        ('ullAvailPhys', ctypes.c_ulonglong),
+        ('ullTotalPageFile', ctypes.c_ulonglong),
+        ('ullAvailPageFile', ctypes.c_ulonglong),
+        ('ullTotalVirtual', ctypes.c_ulonglong),
+        ('ullAvailVirtual', ctypes.c_ulonglong),
+        ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+    ]
+
+
+class RegistrySession:
+    """
+    Відкритий ключ реєстру для серії операцій
+    
+    Ключ відкривається один раз на вході в with-блок і закривається на виході,
+    тому N читань/записів коштують один OpenKey замість N.
+    
+    Приклад:
+        with RegistrySession('HKEY_CURRENT_USER\\Software\\MyApp') as reg:
+            reg.write('Theme', 'dark')
+            theme = reg.read('Theme')
+    """
+    
+    def __init__(self, path: str, access: int = winreg.KEY_READ | winreg.KEY_WRITE):
+        """
+        Args:
+            path: Шлях в реєстрі
+            access: Права доступу до ключа
+        """
+        self.path = path
+        self.hkey, self.subkey = _parse_reg_path(path)
+        self.access = access
+        self.key = None
+    
+    def __enter__(self) -> 'RegistrySession':
+        if not self.hkey:
+            raise ValueError(f"Невідомий розділ реєстру: {self.path}")
+        self.key = winreg.OpenKey(self.hkey, self.subkey, access=self.access)
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        if self.key is not None:
+            self.key.Close()
+            self.key = None
+    
+    def read(self, value: str) -> Optional[Any]:
+        """Прочитати значення (None, якщо його немає)"""
+        try:
+            return winreg.QueryValueEx(self.key, value)[0]
+        except OSError:
+            return None
+    
+    def write(self, value: str, data: Any, type_name: str = 'String') -> bool:
+        """Записати значення (type_name як у registry_write)"""
+        try:
+            winreg.SetValueEx(self.key, value, 0, _REG_TYPE_MAP.get(type_name, winreg.REG_SZ), data)
+            return True
+        except OSError:
+            return False
+    
+    def delete(self, value: str) -> bool:
+        """Видалити значення"""
+        try:
+            winreg.DeleteValue(self.key, value)
+            return True
+        except OSError:
+            return False
+
+
+class _PSHost:
+    """
+    Постійний процес PowerShell
+    
+    Запуск powershell.exe коштує сотні мілісекунд, тому всі команди модуля
+    виконуються в одному процесі: команда пишеться в stdin, а кінець її
+    виводу позначається унікальним маркером.
+    """
+    
+    _proc: Optional[subprocess.Popen] = None
+    _lock = threading.Lock()
+    
+    @classmethod
+    def _ensure_started(cls) -> subprocess.Popen:
+        """Запустити процес, якщо він ще не запущений або завершився"""
+        if cls._proc is None or cls._proc.poll() is not None:
+            cls._proc = subprocess.Popen(
+                [*_PS_ARGV, '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                # stderr не читається, тому не буферизуємо його в pipe
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+        return cls._proc
+    
+    @classmethod
+    def run(cls, cmd: str, timeout: float = 10) -> Tuple[bool, str]:
+        """
+        Виконати команду в постійному процесі
+        
+        Args:
+            cmd: PowerShell команда (один рядок)
+            timeout: Timeout в секундах
+        
+        Returns:
+            Tuple: (успіх, stdout)
+        """
+        token = uuid.uuid4().hex
+        end_marker = f'<<<END:{token}:'
+        
+        with cls._lock:
+            proc = cls._ensure_started()
+            # Процес, що завис, вбивається - наступний виклик запустить новий
+            killer = threading.Timer(timeout, proc.kill)
+            killer.start()
+            try:
+                proc.stdin.write(cmd + '\n')
+                proc.stdin.write(f"Write-Output ('{end_marker}' + $? + '>>>')\n")
+                proc.stdin.flush()
+                
+                lines = []
+                for line in proc.stdout:
+                    if line.startswith(end_marker):
+                        success = line[len(end_marker):].strip().startswith('True')
+                        return success, ''.join(lines)
+                    lines.append(line)
+                return False, ''.join(lines)
+            except (OSError, ValueError):
+                return False, ''
+            finally:
+                killer.cancel()
+
+
+def _run_ps(cmd: str, timeout: float = 10) -> Tuple[bool, str]:
+    """Виконати команду через спільний PowerShell процес"""
+    return _PSHost.run(cmd, timeout=timeout)
+
+
+async def _run_ps_async(cmd: str, *, timeout: float = 10) -> Tuple[bool, str]:
+    """Виконати команду в окремому PowerShell процесі, не блокуючи event loop"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *_PS_ARGV, cmd,
+            # stdin завжди в pipe, інакше powershell може зависнути на Windows
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except OSError:
+        return False, ''
+    
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return False, ''
+    
+    return proc.returncode == 0, stdout.decode(errors='replace')
+
+
+def _json_list(stdout: str) -> List[Dict[str, Any]]:
+    """Розібрати JSON вивід PowerShell як список об'єктів"""
+    try:
+        data = _loads(stdout)
+    except ValueError:
+        return []
+    return data if isinstance(data, list) else [data]
+
+
 class WindowsAutomation:
     """Клас для автоматизації Windows операцій"""
     
+    # Шаблони PowerShell команд (підставляються через str.format)
+    _START_CMD = 'Start-Service -Name "{name}" -ErrorAction SilentlyContinue'
+    _STOP_CMD = 'Stop-Service -Name "{name}" -Force -ErrorAction SilentlyContinue'
+    _RESTART_CMD = 'Restart-Service -Name "{name}" -Force -ErrorAction SilentlyContinue'
+    _CREATE_TASK_CMD = (
+        '$trigger = New-ScheduledTaskTrigger -{trigger}; '
+        '$action = New-ScheduledTaskAction -Execute "powershell.exe" '
+        '-Argument "-NoProfile -WindowStyle Hidden -Command {action}"; '
+        'Register-ScheduledTask -TaskName "{name}" -Trigger $trigger '
+        '-Action $action -Description "{description}" -Force'
+    )
+    _DELETE_TASK_CMD = 'Unregister-ScheduledTask -TaskName "{name}" -Confirm:$false'
+    # Лише потрібні поля - повний об'єкт завдання в десятки разів більший
+    _TASKS_SELECT = 'Get-ScheduledTask | Select-Object TaskName, State, Description'
+    _TASKS_CMD = _TASKS_SELECT + ' | ConvertTo-Json -Compress'
+    # Один JSON об'єкт на рядок для потокового читання
+    _TASKS_STREAM_CMD = _TASKS_SELECT + ' | ForEach-Object { $_ | ConvertTo-Json -Compress }'
+    
     # ============================================================================
     # РОБОТИ З СЕРВІСАМИ
     # ============================================================================
     
+    @classmethod
+    def invalidate(cls) -> None:
+        """Скинути кеш списку сервісів (після зміни їх стану)"""
+        cls.get_services.cache_clear()
+    
     @staticmethod
+    @_ttl_cache(2.0)
     def get_services(name_filter: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Отримати список сервісів
@@ -48,30 +343,65 @@ class WindowsAutomation:
         Returns:
             List: Список сервісів з інформацією
         """
-        cmd = 'Get-Service'
-        if name_filter:
-            cmd += f" -Name '*{name_filter}*' -ErrorAction SilentlyContinue"
-        cmd += ' | ConvertTo-Json -Depth 2'
+        if win32service is not None:
+            services = WindowsAutomation._get_services_native(name_filter)
+            if services is not None:
+                return services
+        
+        cmd = WindowsAutomation._services_cmd(name_filter)
         
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', cmd],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            success, stdout = _run_ps(cmd)
             
-            if result.returncode == 0:
+            if success:
                 try:
-                    data = json.loads(result.stdout)
+                    data = _loads(stdout)
                     return data if isinstance(data, list) else [data]
-                except:
+                except json.JSONDecodeError as e:
+                    logger.debug("Invalid PowerShell JSON: %s", e)
                     return []
-        except:
-            pass
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
         
         return []
     
+    @staticmethod
+    def _services_cmd(name_filter: Optional[str] = None) -> str:
+        """Побудувати команду Get-Service"""
+        cmd = 'Get-Service'
+        if name_filter:
+            cmd += f" -Name '*{name_filter}*' -ErrorAction SilentlyContinue"
+        return cmd + (
+            " | Select-Object Name, DisplayName, @{N='Status';E={$_.Status.ToString()}}"
+            ' | ConvertTo-Json -Compress'
+        )
+    
+    @staticmethod
+    def _get_services_native(name_filter: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """Отримати сервіси напряму з Service Control Manager (pywin32)"""
+        try:
+            scm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_ENUMERATE_SERVICE)
+            try:
+                entries = win32service.EnumServicesStatus(
+                    scm, win32service.SERVICE_WIN32, win32service.SERVICE_STATE_ALL
+                )
+            finally:
+                win32service.CloseServiceHandle(scm)
+        except Exception:
+            return None
+        
+        needle = name_filter.lower() if name_filter else None
+        services = []
+        for name, display_name, status in entries:
+            if needle and needle not in name.lower():
+                continue
+            services.append({
+                'Name': name,
+                'DisplayName': display_name,
+                'Status': _SERVICE_STATE_NAMES.get(status[1], str(status[1])),
+            })
+        return services
+    
     @staticmethod
     def get_service_status(name: str) -> Optional[ServiceStatus]:
         """
@@ -85,11 +415,7 @@ class WindowsAutomation:
         """
         services = WindowsAutomation.get_services(name)
         if services and services[0].get('Status'):
-            status_str = services[0]['Status']
-            try:
-                return ServiceStatus(status_str)
-            except:
-                return None
+            return _STATUS_BY_STR.get(services[0]['Status'])
         return None
     
     @staticmethod
@@ -103,16 +429,14 @@ class WindowsAutomation:
         Returns:
             bool: Успіх
         """
-        cmd = f'Start-Service -Name "{name}" -ErrorAction SilentlyContinue'
+        cmd = WindowsAutomation._START_CMD.format(name=name)
         
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', cmd],
-                capture_output=True,
-                timeout=10
-            )
-            return result.returncode == 0
-        except:
+            success, _ = _run_ps(cmd)
+            WindowsAutomation.invalidate()
+            return success
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
             return False
     
     @staticmethod
@@ -126,16 +450,14 @@ class WindowsAutomation:
         Returns:
             bool: Успіх
         """
-        cmd = f'Stop-Service -Name "{name}" -Force -ErrorAction SilentlyContinue'
+        cmd = WindowsAutomation._STOP_CMD.format(name=name)
         
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', cmd],
-                capture_output=True,
-                timeout=10
-            )
-            return result.returncode == 0
-        except:
+            success, _ = _run_ps(cmd)
+            WindowsAutomation.invalidate()
+            return success
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
             return False
     
     @staticmethod
@@ -149,7 +471,45 @@ class WindowsAutomation:
         Returns:
             bool: Успіх
         """
-        return WindowsAutomation.stop_service(name) and WindowsAutomation.start_service(name)
+        if win32service is not None:
+            success = WindowsAutomation._restart_service_native(name)
+        else:
+            cmd = WindowsAutomation._RESTART_CMD.format(name=name)
+            try:
+                success, _ = _run_ps(cmd)
+            except _PS_ERRORS as e:
+                logger.debug("PowerShell call failed: %s", e)
+                success = False
+        
+        WindowsAutomation.invalidate()
+        return success
+    
+    @staticmethod
+    def _restart_service_native(name: str, timeout: float = 10) -> bool:
+        """Перезапустити сервіс через Service Control Manager (pywin32)"""
+        try:
+            scm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_CONNECT)
+            try:
+                handle = win32service.OpenService(
+                    scm, name,
+                    win32service.SERVICE_STOP | win32service.SERVICE_START | win32service.SERVICE_QUERY_STATUS
+                )
+                try:
+                    if win32service.QueryServiceStatus(handle)[1] != win32service.SERVICE_STOPPED:
+                        win32service.ControlService(handle, win32service.SERVICE_CONTROL_STOP)
+                        deadline = time.monotonic() + timeout
+                        while win32service.QueryServiceStatus(handle)[1] != win32service.SERVICE_STOPPED:
+                            if time.monotonic() >= deadline:
+                                return False
+                            time.sleep(0.1)
+                    win32service.StartService(handle, None)
+                    return True
+                finally:
+                    win32service.CloseServiceHandle(handle)
+            finally:
+                win32service.CloseServiceHandle(scm)
+        except Exception:
+            return False
     
     # ============================================================================
     # РОБОТИ З РЕЄСТРОМ
@@ -168,30 +528,75 @@ class WindowsAutomation:
             Any: Значення з реєстру
         """
         try:
-            # Розпарсити шлях
-            parts = path.split('\\')
-            hkey_str = parts[0]
-            subkey = '\\'.join(parts[1:])
-            
-            #映射 hkey
-            hkey_map = {
-                'HKEY_LOCAL_MACHINE': winreg.HKEY_LOCAL_MACHINE,
-                'HKEY_CURRENT_USER': winreg.HKEY_CURRENT_USER,
-                'HKEY_CLASSES_ROOT': winreg.HKEY_CLASSES_ROOT,
-                'HKEY_USERS': winreg.HKEY_USERS,
-                'HKEY_CURRENT_CONFIG': winreg.HKEY_CURRENT_CONFIG,
-            }
-            
-            hkey = hkey_map.get(hkey_str)
+            hkey, subkey = _parse_reg_path(path)
             if not hkey:
                 return None
             
             with winreg.OpenKey(hkey, subkey, access=winreg.KEY_READ) as key:
                 value_data, _ = winreg.QueryValueEx(key, value)
                 return value_data
-        except Exception as e:
+        except OSError as e:
+            logger.debug("Registry read %s\\%s failed: %s", path, value, e)
             return None
     
+    @staticmethod
+    def registry_read_many(path: str, values: List[str]) -> Dict[str, Any]:
+        """
+        Прочитати кілька значень з одного ключа реєстру
+        
+        Ключ відкривається один раз для всіх значень.
+        
+        Args:
+            path: Шлях в реєстрі
+            values: Імена значень
+        
+        Returns:
+            Dict: Ім'я значення -> дані (None, якщо значення відсутнє)
+        """
+        hkey, subkey = _parse_reg_path(path)
+        if not hkey:
+            return {}
+        
+        result = {}
+        try:
+            with winreg.OpenKey(hkey, subkey, access=winreg.KEY_READ) as key:
+                for value in values:
+                    try:
+                        result[value] = winreg.QueryValueEx(key, value)[0]
+                    except OSError:
+                        result[value] = None
+        except OSError:
+            return {}
+        return result
+    
+    @staticmethod
+    def registry_dump(path: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Перебрати всі значення ключа реєстру
+        
+        Args:
+            path: Шлях в реєстрі
+        
+        Yields:
+            Tuple: (ім'я значення, дані)
+        """
+        hkey, subkey = _parse_reg_path(path)
+        if not hkey:
+            return
+        
+        try:
+            with winreg.OpenKey(hkey, subkey, access=winreg.KEY_READ) as key:
+                i = 0
+                while True:
+                    try:
+                        name, data, _ = winreg.EnumValue(key, i)
+                    except OSError:
+                        break
+                    yield name, data
+                    i += 1
+        except OSError:
+            return
+    
     @staticmethod
     def registry_write(path: str, value: str, data: Any, type_name: str = 'String') -> bool:
         """
@@ -207,37 +612,17 @@ class WindowsAutomation:
             bool: Успіх
         """
         try:
-            parts = path.split('\\')
-            hkey_str = parts[0]
-            subkey = '\\'.join(parts[1:])
-            
-            hkey_map = {
-                'HKEY_LOCAL_MACHINE': winreg.HKEY_LOCAL_MACHINE,
-                'HKEY_CURRENT_USER': winreg.HKEY_CURRENT_USER,
-                'HKEY_CLASSES_ROOT': winreg.HKEY_CLASSES_ROOT,
-                'HKEY_USERS': winreg.HKEY_USERS,
-                'HKEY_CURRENT_CONFIG': winreg.HKEY_CURRENT_CONFIG,
-            }
-            
-            hkey = hkey_map.get(hkey_str)
+            hkey, subkey = _parse_reg_path(path)
             if not hkey:
                 return False
             
-            # Маппинг типів
-            type_map = {
-                'String': winreg.REG_SZ,
-                'DWORD': winreg.REG_DWORD,
-                'Binary': winreg.REG_BINARY,
-                'ExpandString': winreg.REG_EXPAND_SZ,
-                'MultiString': winreg.REG_MULTI_SZ,
-            }
-            
-            reg_type = type_map.get(type_name, winreg.REG_SZ)
+            reg_type = _REG_TYPE_MAP.get(type_name, winreg.REG_SZ)
             
             with winreg.CreateKey(hkey, subkey) as key:
                 winreg.SetValueEx(key, value, 0, reg_type, data)
                 return True
-        except:
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Registry write %s\\%s failed: %s", path, value, e)
             return False
     
     @staticmethod
@@ -253,19 +638,7 @@ class WindowsAutomation:
             bool: Успіх
         """
         try:
-            parts = path.split('\\')
-            hkey_str = parts[0]
-            subkey = '\\'.join(parts[1:])
-            
-            hkey_map = {
-                'HKEY_LOCAL_MACHINE': winreg.HKEY_LOCAL_MACHINE,
-                'HKEY_CURRENT_USER': winreg.HKEY_CURRENT_USER,
-                'HKEY_CLASSES_ROOT': winreg.HKEY_CLASSES_ROOT,
-                'HKEY_USERS': winreg.HKEY_USERS,
-                'HKEY_CURRENT_CONFIG': winreg.HKEY_CURRENT_CONFIG,
-            }
-            
-            hkey = hkey_map.get(hkey_str)
+            hkey, subkey = _parse_reg_path(path)
             if not hkey:
                 return False
             
@@ -278,7 +651,8 @@ class WindowsAutomation:
                 winreg.DeleteKey(hkey, subkey)
             
             return True
-        except:
+        except OSError as e:
+            logger.debug("Registry delete %s failed: %s", path, e)
             return False
     
     # ============================================================================
@@ -306,22 +680,15 @@ class WindowsAutomation:
         Returns:
             bool: Успіх
         """
-        cmd = (
-            f'$trigger = New-ScheduledTaskTrigger -{trigger}; '
-            f'$action = New-ScheduledTaskAction -Execute "powershell.exe" '
-            f'-Argument "-NoProfile -WindowStyle Hidden -Command {action}"; '
-            f'Register-ScheduledTask -TaskName "{name}" -Trigger $trigger '
-            f'-Action $action -Description "{description}" -Force'
+        cmd = WindowsAutomation._CREATE_TASK_CMD.format(
+            name=name, trigger=trigger, action=action, description=description
         )
         
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', cmd],
-                capture_output=True,
-                timeout=10
-            )
-            return result.returncode == 0
-        except:
+            success, _ = _run_ps(cmd)
+            return success
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
             return False
     
     @staticmethod
@@ -335,16 +702,13 @@ class WindowsAutomation:
         Returns:
             bool: Успіх
         """
-        cmd = f'Unregister-ScheduledTask -TaskName "{name}" -Confirm:$false'
+        cmd = WindowsAutomation._DELETE_TASK_CMD.format(name=name)
         
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', cmd],
-                capture_output=True,
-                timeout=10
-            )
-            return result.returncode == 0
-        except:
+            success, _ = _run_ps(cmd)
+            return success
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
             return False
     
     @staticmethod
@@ -355,27 +719,59 @@ class WindowsAutomation:
         Returns:
             List: Список завдань
         """
-        cmd = 'Get-ScheduledTask | ConvertTo-Json -Depth 2'
+        cmd = WindowsAutomation._TASKS_CMD
         
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', cmd],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            success, stdout = _run_ps(cmd)
             
-            if result.returncode == 0:
+            if success:
                 try:
-                    data = json.loads(result.stdout)
+                    data = _loads(stdout)
                     return data if isinstance(data, list) else [data]
-                except:
+                except json.JSONDecodeError as e:
+                    logger.debug("Invalid PowerShell JSON: %s", e)
                     return []
-        except:
-            pass
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
         
         return []
     
+    @staticmethod
+    def iter_tasks() -> Iterator[Dict[str, Any]]:
+        """
+        Перебрати заплановані завдання по одному
+        
+        На відміну від get_tasks, вивід PowerShell не накопичується в пам'яті:
+        кожне завдання розбирається одразу, як тільки рядок прочитано.
+        
+        Yields:
+            Dict: Інформація про завдання
+        """
+        try:
+            proc = subprocess.Popen(
+                [*_PS_ARGV, WindowsAutomation._TASKS_STREAM_CMD],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return
+        
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield _loads(line)
+                except ValueError:
+                    continue
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+    
     # ============================================================================
     # КЕРУВАННЯ ВІКНАМИ
     # ============================================================================
@@ -401,28 +797,72 @@ class WindowsAutomation:
                     'is_active': win.isActive if hasattr(win, 'isActive') else False
                 })
             return windows
-        except:
-            # Fallback до PowerShell
-            cmd = 'Get-Process | Where-Object {$_.MainWindowTitle} | ConvertTo-Json -Depth 2'
+        except Exception as e:
+            logger.debug("pygetwindow unavailable: %s", e)
+            windows = WindowsAutomation._get_windows_native()
+            if windows is not None:
+                return windows
+            
+            # Fallback до PowerShell (лише потрібні поля процесу)
+            cmd = (
+                'Get-Process | Where-Object MainWindowTitle | '
+                'Select-Object Id, ProcessName, MainWindowTitle | ConvertTo-Json -Compress -Depth 1'
+            )
             try:
+                # Байти напряму - orjson розбирає їх без декодування
                 result = subprocess.run(
-                    ['powershell', '-Command', cmd],
+                    [*_PS_ARGV, cmd],
                     capture_output=True,
-                    text=True,
                     timeout=10
                 )
                 if result.returncode == 0:
-                    data = json.loads(result.stdout)
+                    data = _loads(result.stdout)
                     return data if isinstance(data, list) else [data]
-            except:
-                pass
+            except _PS_ERRORS as e:
+                logger.debug("PowerShell call failed: %s", e)
             return []
     
+    @staticmethod
+    def _get_windows_native() -> Optional[List[Dict[str, Any]]]:
+        """Перелічити видимі вікна з заголовком через user32.EnumWindows"""
+        try:
+            user32 = ctypes.windll.user32
+        except AttributeError:
+            return None
+        
+        foreground = user32.GetForegroundWindow()
+        windows = []
+        
+        def callback(hwnd, _lparam):
+            if not user32.IsWindowVisible(hwnd):
+                return True
+            length = user32.GetWindowTextLengthW(hwnd)
+            if not length:
+                return True
+            buf = ctypes.create_unicode_buffer(length + 1)
+            user32.GetWindowTextW(hwnd, buf, length + 1)
+            rect = wintypes.RECT()
+            user32.GetWindowRect(hwnd, ctypes.byref(rect))
+            windows.append({
+                'title': buf.value,
+                'x': rect.left,
+                'y': rect.top,
+                'width': rect.right - rect.left,
+                'height': rect.bottom - rect.top,
+                'is_active': hwnd == foreground
+            })
+            return True
+        
+        if not user32.EnumWindows(_WNDENUMPROC(callback), 0):
+            return None
+        return windows
+    
     # ============================================================================
     # СИСТЕМНА ІНФОРМАЦІЯ
     # ============================================================================
     
     @staticmethod
+    @_ttl_cache(60.0)
     def get_system_info() -> Dict[str, Any]:
         """
         Отримати інформацію про систему
@@ -430,31 +870,61 @@ class WindowsAutomation:
         Returns:
             Dict: Інформація про систему
         """
+        info = WindowsAutomation._get_system_info_native()
+        if info:
+            return info
+        
         cmd = (
             'Get-WmiObject -Class Win32_ComputerSystem | '
             'Select-Object Name, Manufacturer, Model, @{N="RAM_GB";E={[math]::Round($_.TotalPhysicalMemory/1GB)}} | '
-            'ConvertTo-Json'
+            'ConvertTo-Json -Compress'
         )
         
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', cmd],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            success, stdout = _run_ps(cmd)
             
-            if result.returncode == 0:
+            if success:
                 try:
-                    return json.loads(result.stdout)
-                except:
+                    return _loads(stdout)
+                except json.JSONDecodeError as e:
+                    logger.debug("Invalid PowerShell JSON: %s", e)
                     return {}
-        except:
-            pass
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
         
         return {}
     
     @staticmethod
+    def _get_system_info_native() -> Dict[str, Any]:
+        """Отримати інформацію про систему через kernel32 та реєстр"""
+        try:
+            kernel32 = ctypes.windll.kernel32
+            
+            size = wintypes.DWORD(256)
+            name_buf = ctypes.create_unicode_buffer(size.value)
+            if not kernel32.GetComputerNameW(name_buf, ctypes.byref(size)):
+                return {}
+            
+            mem = _MEMORYSTATUSEX()
+            mem.dwLength = ctypes.sizeof(_MEMORYSTATUSEX)
+            if not kernel32.GlobalMemoryStatusEx(ctypes.byref(mem)):
+                return {}
+        except (AttributeError, OSError):
+            return {}
+        
+        bios = WindowsAutomation.registry_read_many(
+            'HKEY_LOCAL_MACHINE\\HARDWARE\\DESCRIPTION\\System\\BIOS',
+            ['SystemManufacturer', 'SystemProductName']
+        )
+        return {
+            'Name': name_buf.value,
+            'Manufacturer': bios.get('SystemManufacturer'),
+            'Model': bios.get('SystemProductName'),
+            'RAM_GB': round(mem.ullTotalPhys / (1024 ** 3)),
+        }
+    
+    @staticmethod
+    @_ttl_cache(60.0)
     def get_windows_info() -> Dict[str, str]:
         """
         Отримати інформацію про Windows версію
@@ -464,24 +934,20 @@ class WindowsAutomation:
         """
         cmd = (
             'Get-WmiObject -Class Win32_OperatingSystem | '
-            'Select-Object Caption, Version, BuildNumber | ConvertTo-Json'
+            'Select-Object Caption, Version, BuildNumber | ConvertTo-Json -Compress'
         )
         
         try:
-            result = subprocess.run(
-                ['powershell', '-Command', cmd],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            success, stdout = _run_ps(cmd)
             
-            if result.returncode == 0:
+            if success:
                 try:
-                    return json.loads(result.stdout)
-                except:
+                    return _loads(stdout)
+                except json.JSONDecodeError as e:
+                    logger.debug("Invalid PowerShell JSON: %s", e)
                     return {}
-        except:
-            pass
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
         
         return {}
     
@@ -501,16 +967,17 @@ class WindowsAutomation:
         Returns:
             bool: Успіх
         """
-        cmd = f'Stop-Computer -ComputerName localhost -Force'
+        cmd = 'Stop-Computer -ComputerName localhost -Force'
         
         try:
             result = subprocess.run(
-                ['powershell', '-Command', cmd],
+                [*_PS_ARGV, cmd],
                 capture_output=True,
                 timeout=10
             )
             return result.returncode == 0
-        except:
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
             return False
     
     @staticmethod
@@ -524,16 +991,17 @@ class WindowsAutomation:
         Returns:
             bool: Успіх
         """
-        cmd = f'Restart-Computer -ComputerName localhost -Force'
+        cmd = 'Restart-Computer -ComputerName localhost -Force'
         
         try:
             result = subprocess.run(
-                ['powershell', '-Command', cmd],
+                [*_PS_ARGV, cmd],
                 capture_output=True,
                 timeout=10
             )
             return result.returncode == 0
-        except:
+        except _PS_ERRORS as e:
+            logger.debug("PowerShell call failed: %s", e)
             return False
     
     @staticmethod
@@ -549,8 +1017,67 @@ class WindowsAutomation:
         try:
             subprocess.run(cmd, shell=True, timeout=5)
             return True
-        except:
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.debug("Suspend failed: %s", e)
             return False
+    
+    # ============================================================================
+    # АСИНХРОННИЙ API
+    # ============================================================================
+    
+    @staticmethod
+    async def get_services_async(name_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Асинхронна версія get_services"""
+        if win32service is not None:
+            return await asyncio.to_thread(WindowsAutomation.get_services, name_filter)
+        
+        success, stdout = await _run_ps_async(WindowsAutomation._services_cmd(name_filter))
+        return _json_list(stdout) if success else []
+    
+    @staticmethod
+    async def start_service_async(name: str) -> bool:
+        """Асинхронна версія start_service"""
+        success, _ = await _run_ps_async(WindowsAutomation._START_CMD.format(name=name))
+        WindowsAutomation.invalidate()
+        return success
+    
+    @staticmethod
+    async def stop_service_async(name: str) -> bool:
+        """Асинхронна версія stop_service"""
+        success, _ = await _run_ps_async(WindowsAutomation._STOP_CMD.format(name=name))
+        WindowsAutomation.invalidate()
+        return success
+    
+    @staticmethod
+    async def create_task_async(
+        name: str,
+        trigger: str,
+        action: str,
+        enabled: bool = True,
+        description: str = ''
+    ) -> bool:
+        """Асинхронна версія create_task"""
+        cmd = WindowsAutomation._CREATE_TASK_CMD.format(
+            name=name, trigger=trigger, action=action, description=description
+        )
+        success, _ = await _run_ps_async(cmd)
+        return success
+    
+    @staticmethod
+    async def get_tasks_async() -> List[Dict[str, str]]:
+        """Асинхронна версія get_tasks"""
+        success, stdout = await _run_ps_async(WindowsAutomation._TASKS_CMD)
+        return _json_list(stdout) if success else []
+    
+    @staticmethod
+    async def registry_read_async(path: str, value: str) -> Optional[Any]:
+        """Асинхронна версія registry_read (виконується в пулі потоків)"""
+        return await asyncio.to_thread(WindowsAutomation.registry_read, path, value)
+    
+    @staticmethod
+    async def registry_write_async(path: str, value: str, data: Any, type_name: str = 'String') -> bool:
+        """Асинхронна версія registry_write (виконується в пулі потоків)"""
+        return await asyncio.to_thread(WindowsAutomation.registry_write, path, value, data, type_name)
 
 
 # ============================================================================
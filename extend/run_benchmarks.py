@@ -1,33 +1,94 @@
 
+import gc
+import sys
+import copy
 import time
 import statistics
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from timeit import Timer
 from aml.aml_runtime import AMLRuntime
 
+# Loop trip count of every benchmark below, used for the ns/op column
+OPS_PER_RUN = 100_000
+
+# Compiled programs keyed by source, so identical snippets are parsed once
+_program_cache = {}
+
+def compile_cached(runtime, aml_code):
+    program = _program_cache.get(aml_code)
+    if program is None:
+        program = runtime.compile_source(aml_code)
+        _program_cache[aml_code] = program
+    return program
+
+def make_runner(program, aml_code):
+    # AST nodes cache dispatch handlers bound to the interpreter that runs them,
+    # so every interpreter gets its own copy; the cached program stays pristine
+    runtime = AMLRuntime()
+    # Defines the functions and runs the entrypoint once (untimed)
+    runtime.run_program(copy.deepcopy(program), aml_code)
+    if runtime.get_metadata().get('entry'):
+        # The entrypoint is auto-invoked only once per interpreter; call it directly
+        return runtime.invoke_entrypoint
+    return lambda: AMLRuntime().run_program(copy.deepcopy(program), aml_code)
+
 def run_aml_benchmark(name, aml_code, iterations=5):
-    results_str = f"Running {name} ({iterations} iterations)...\n"
+    results_str = f"Running {name} ({iterations} samples)...\n"
     
-    times = []
-    for i in range(iterations):
-        runtime = AMLRuntime()
-        
-        start_time = time.perf_counter()
-        try:
-            runtime.run_source(aml_code)
-            end_time = time.perf_counter()
-            times.append(end_time - start_time)
-            
-        except Exception as e:
-            return None, f"ERROR in {name} at iteration {i}: {e}\n"
+    try:
+        parse_start = time.perf_counter()
+        program = compile_cached(AMLRuntime(), aml_code)
+        parse_time = time.perf_counter() - parse_start
+    except Exception as e:
+        return None, f"ERROR in {name} while parsing: {e}\n"
+    
+    try:
+        runner = make_runner(program, aml_code)
+        # Untimed warmup: one-shot import and specialization costs stay out of the samples
+        runner()
+        timer = Timer(runner)
+        # Pick a loop count so one sample runs for at least 0.2 s
+        loops, _ = timer.autorange()
+        times = []
+        for i in range(iterations):
+            gc.collect()
+            # Timer.timeit disables gc for the timed region
+            times.append(timer.timeit(loops) / loops)
+    except Exception as e:
+        return None, f"ERROR in {name}: {e}\n"
     
+    avg = statistics.mean(times)
     stats = {
+        'parse': parse_time,
+        'loops': loops,
         'min': min(times),
         'max': max(times),
-        'avg': statistics.mean(times),
-        'stdev': statistics.stdev(times) if len(times) > 1 else 0
+        'avg': avg,
+        'stdev': statistics.stdev(times) if len(times) > 1 else 0,
+        'ns_per_op': avg / OPS_PER_RUN * 1e9
     }
     return stats, results_str
 
+def pin_to_cpu(cpu):
+    # Keep a worker on one core to avoid cross-core migration jitter
+    try:
+        if hasattr(os, 'sched_setaffinity'):
+            cpus = sorted(os.sched_getaffinity(0))
+            os.sched_setaffinity(0, {cpus[cpu % len(cpus)]})
+        elif sys.platform == 'win32':
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetProcessAffinityMask(kernel32.GetCurrentProcess(), 1 << (cpu % (os.cpu_count() or 1)))
+    except (OSError, AttributeError):
+        pass
+
+def run_pinned_benchmark(cpu, name, aml_code, iterations=5):
+    pin_to_cpu(cpu)
+    # Fewer forced GIL hand-offs while the single benchmark thread runs
+    sys.setswitchinterval(1.0)
+    return run_aml_benchmark(name, aml_code, iterations)
+
 # 1. Benchmark WHILE loop
 while_code = """
 meta { entry: "main" }
@@ -103,19 +164,24 @@ if __name__ == "__main__":
             ("Nested Loops (100k total)", nested_code),
         ]
         
+        # Benchmarks are independent: run each in its own process
         results = {}
-        for name, code in benchmarks:
-            print(f"Starting {name}...", flush=True)
-            stats, log = run_aml_benchmark(name, code, iterations=ITERATIONS)
-            print(log.strip(), flush=True)
-            f.write(log)
-            f.flush()
-            if stats:
-                results[name] = stats
+        with ProcessPoolExecutor(max_workers=len(benchmarks)) as pool:
+            futures = {}
+            for cpu, (name, code) in enumerate(benchmarks):
+                print(f"Starting {name}...", flush=True)
+                futures[pool.submit(run_pinned_benchmark, cpu, name, code, ITERATIONS)] = name
+            for fut in as_completed(futures):
+                stats, log = fut.result()
+                print(log.strip(), flush=True)
+                f.write(log)
+                f.flush()
+                if stats:
+                    results[futures[fut]] = stats
 
-        summary_header = "\n" + "="*85 + "\n"
-        table_header = f"{'Benchmark Name':<30} | {'Avg (s)':<12} | {'Min (s)':<12} | {'Max (s)':<12} | {'Stdev':<10}\n"
-        separator = "-" * 85 + "\n"
+        summary_header = "\n" + "="*115 + "\n"
+        table_header = f"{'Benchmark Name':<30} | {'ns/op':<10} | {'Parse (s)':<12} | {'Avg (s)':<12} | {'Min (s)':<12} | {'Max (s)':<12} | {'Stdev':<10}\n"
+        separator = "-" * 115 + "\n"
         
         print(summary_header, end="")
         print(table_header, end="")
@@ -125,12 +191,15 @@ if __name__ == "__main__":
         f.write(table_header)
         f.write(separator)
         
-        for name, stats in results.items():
-            row = f"{name:<30} | {stats['avg']:<12.6f} | {stats['min']:<12.6f} | {stats['max']:<12.6f} | {stats['stdev']:<10.4f}\n"
+        for name, _ in benchmarks:
+            stats = results.get(name)
+            if not stats:
+                continue
+            row = f"{name:<30} | {stats['ns_per_op']:<10.1f} | {stats['parse']:<12.6f} | {stats['avg']:<12.6f} | {stats['min']:<12.6f} | {stats['max']:<12.6f} | {stats['stdev']:<10.4f}\n"
             print(row, end="")
             f.write(row)
         
-        footer = "="*85 + "\n"
+        footer = "="*115 + "\n"
         print(footer)
         f.write(footer)
     
@@ -3,6 +3,8 @@
 
 import time
 import math
+import threading
+from functools import lru_cache
 
 try:
     import pyautogui
@@ -10,6 +12,24 @@ except ImportError:
     print("PyAutoGUI is not installed. Please install it using 'pip install pyautogui'")
     pyautogui = None
 
+# Direct OS primitives for the per-step hot loops: they skip pyautogui's PAUSE and failsafe checks
+_move = None
+_position = None
+if pyautogui:
+    _platform = getattr(pyautogui, 'platformModule', None)
+    _move = getattr(_platform, '_moveTo', None) or pyautogui.moveTo
+    _position = getattr(_platform, '_position', None) or pyautogui.position
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 try:
     from pynput import keyboard as pynput_keyboard
     from pynput.keyboard import Controller, Key
@@ -22,16 +42,29 @@ except Exception as e:
 
 # --- Mouse Functions ---
 
+# Screen size is read once; call refresh_screen_size() after a display change
+_SCREEN_SIZE = (None, None)
+_W = _H = None
+
+def refresh_screen_size():
+    """Re-reads the screen size from the OS and returns it as a (width, height) tuple."""
+    global _SCREEN_SIZE, _W, _H
+    if pyautogui:
+        w, h = pyautogui.size()
+        _SCREEN_SIZE = (w, h)
+        _W, _H = int(w), int(h)
+    return _SCREEN_SIZE
+
+refresh_screen_size()
+
 def get_screen_size():
     """Returns the screen size as a (width, height) tuple."""
-    if pyautogui:
-        return pyautogui.size()
-    return (None, None)
+    return _SCREEN_SIZE
 
 def get_mouse_position():
     """Returns the current mouse position as an (x, y) tuple."""
     if pyautogui:
-        return pyautogui.position()
+        return _position()
     return (0, 0)
 
 def move_mouse_smooth(x, y, duration=0.5, steps=20):
@@ -44,7 +77,7 @@ def move_mouse_smooth(x, y, duration=0.5, steps=20):
         print("PyAutoGUI is not available.")
         return
 
-    start_x, start_y = pyautogui.position()
+    start_x, start_y = _position()
     dx = x - start_x
     dy = y - start_y
 
@@ -52,17 +85,24 @@ def move_mouse_smooth(x, y, duration=0.5, steps=20):
         return
 
     step_duration = duration / steps
+    if duration <= 0:
+        _move(int(x), int(y))
+        return
 
-    for i in range(1, steps + 1):
-        progress = i / steps
+    # Progress follows the wall clock, so sleep overshoot does not stretch the total duration
+    t0 = time.perf_counter()
+    while True:
+        elapsed = time.perf_counter() - t0
+        progress = elapsed / duration
+        if progress > 1.0:
+            progress = 1.0
         # Ease-out curve for more natural movement
-        ease_progress = 1 - (1 - progress)**3
-
-        next_x = start_x + dx * ease_progress
-        next_y = start_y + dy * ease_progress
-
-        pyautogui.moveTo(next_x, next_y)
-        time.sleep(step_duration)
+        d = 1 - progress
+        ease = 1 - d * d * d
+        _move(int(start_x + dx * ease), int(start_y + dy * ease))
+        if progress >= 1.0:
+            break
+        time.sleep(step_duration - (time.perf_counter() - t0) % step_duration)
 
 def move_mouse_relative_smooth(dx, dy, duration=0.5, steps=20):
     """
@@ -72,7 +112,7 @@ def move_mouse_relative_smooth(dx, dy, duration=0.5, steps=20):
         print("PyAutoGUI is not available.")
         return
 
-    start_x, start_y = pyautogui.position()
+    start_x, start_y = _position()
     target_x = start_x + dx
     target_y = start_y + dy
     move_mouse_smooth(target_x, target_y, duration, steps)
@@ -114,6 +154,10 @@ SPECIAL_KEYS = {
     'left': 'left', 'right': 'right', 'up': 'up', 'down': 'down'
 }
 
+# Aliases resolved to pynput Key objects once at import
+_SPECIAL_KEY_OBJS = {alias: getattr(Key, attr) for alias, attr in SPECIAL_KEYS.items()} if Key else {}
+
+@lru_cache(maxsize=256)
 def _key_from_string(key_str):
     """Maps a string like 'a', 'enter', 'ctrl' to a pynput Key/KeyCode."""
     if not _controller: return None
@@ -124,8 +168,9 @@ def _key_from_string(key_str):
 
     if not Key: return None
 
-    if lower in SPECIAL_KEYS:
-        return getattr(Key, SPECIAL_KEYS[lower])
+    special = _SPECIAL_KEY_OBJS.get(lower)
+    if special is not None:
+        return special
 
     if len(k) == 1:
         return pynput_keyboard.KeyCode.from_char(k)
@@ -135,6 +180,11 @@ def _key_from_string(key_str):
 
     return pynput_keyboard.KeyCode.from_char(k[0])
 
+@lru_cache(maxsize=256)
+def _map_hotkey(keys):
+    """Maps a tuple of key strings to a tuple of pynput keys (cached per combination)."""
+    return tuple(_key_from_string(k) for k in keys)
+
 def hotkey(*keys):
     """
     Presses a hotkey combination (e.g., 'ctrl', 'shift', 'a').
@@ -144,7 +194,7 @@ def hotkey(*keys):
         print("pynput is not available. Cannot press hotkey.")
         return
 
-    mapped_keys = [_key_from_string(k) for k in keys]
+    mapped_keys = _map_hotkey(keys)
 
     if any(k is None for k in mapped_keys):
         print(f"Unknown key(s) in hotkey combination: {keys}")
@@ -162,22 +212,32 @@ def type_text(text, interval=0.01):
         print("pynput is not available. Cannot type text.")
         return
 
-    for char in str(text):
-        _controller.press(char)
-        _controller.release(char)
+    text = str(text)
+    if interval <= 0:
+        _controller.type(text)
+        return
+
+    for char in text:
+        _controller.type(char)
         time.sleep(interval)
 
 # --- Extended Mouse Helpers ---
 
 def clamp_to_screen(x, y):
     """Clamp coordinates to the screen bounds."""
-    size = get_screen_size()
-    if not size or size[0] is None:
+    if _W is None:
         return (x, y)
-    w, h = size
-    cx = max(0, min(int(x), int(w) - 1))
-    cy = max(0, min(int(y), int(h) - 1))
-    return (cx, cy)
+    x = int(x)
+    y = int(y)
+    if x < 0:
+        x = 0
+    elif x >= _W:
+        x = _W - 1
+    if y < 0:
+        y = 0
+    elif y >= _H:
+        y = _H - 1
+    return (x, y)
 
 def move_mouse_to_ratio(rx, ry, duration=0.5, steps=20):
     """Move smoothly to a position given as ratio of screen size (0..1)."""
@@ -209,7 +269,7 @@ def move_mouse_bezier_to(x, y, duration=0.8, steps=40, c1=None, c2=None, jitter=
     if not pyautogui:
         print("PyAutoGUI is not available.")
         return
-    sx, sy = pyautogui.position()
+    sx, sy = _position()
     ex, ey = x, y
 
     dx = ex - sx
@@ -226,21 +286,74 @@ def move_mouse_bezier_to(x, y, duration=0.8, steps=40, c1=None, c2=None, jitter=
         c1 = (c1[0] + random.uniform(-jitter, jitter), c1[1] + random.uniform(-jitter, jitter))
         c2 = (c2[0] + random.uniform(-jitter, jitter), c2[1] + random.uniform(-jitter, jitter))
 
-    def bezier(p0, p1, p2, p3, t):
-        # Cubic Bezier interpolation
-        u = 1 - t
-        return (
-            u**3 * p0[0] + 3 * u**2 * t * p1[0] + 3 * u * t**2 * p2[0] + t**3 * p3[0],
-            u**3 * p0[1] + 3 * u**2 * t * p1[1] + 3 * u * t**2 * p2[1] + t**3 * p3[1],
-        )
-
     step_duration = duration / steps
+    for nx, ny in zip(*_bezier_path((sx, sy), c1, c2, (ex, ey), steps)):
+        _move(nx, ny)
+        time.sleep(step_duration)
+
+def _sample_bezier_kernel(x0, y0, c1x, c1y, c2x, c2y, c3x, c3y, steps, w, h):
+    """Horner-form Bezier sampling with int clamping into two int32 arrays (compiled by numba)."""
+    xs = np.empty(steps, np.int32)
+    ys = np.empty(steps, np.int32)
+    for i in range(steps):
+        t = (i + 1) / steps
+        nx = int(x0 + t * (c1x + t * (c2x + t * c3x)))
+        ny = int(y0 + t * (c1y + t * (c2y + t * c3y)))
+        xs[i] = min(max(nx, 0), w - 1)
+        ys[i] = min(max(ny, 0), h - 1)
+    return xs, ys
+
+# Explicit signature: compiled eagerly instead of on the first mouse move
+_SAMPLE_BEZIER_SIG = "Tuple((int32[:], int32[:]))(float64, float64, float64, float64, float64, float64, float64, float64, int64, int64, int64)"
+
+# Set once the background compile finishes; until then _bezier_path uses numpy
+_sample_bezier = None
+
+def _compile_sample_bezier():
+    global _sample_bezier
+    try:
+        # No cache=True: the package directory may be read-only
+        _sample_bezier = njit(_SAMPLE_BEZIER_SIG)(_sample_bezier_kernel)
+    except Exception as e:
+        print(f"numba compile of the Bezier sampler failed, using numpy: {e}")
+
+if njit is not None and np is not None:
+    threading.Thread(target=_compile_sample_bezier, name="aml-bezier-jit", daemon=True).start()
+
+def _bezier_path(p0, p1, p2, p3, steps):
+    """
+    Sample a cubic Bezier curve at t = 1/steps .. 1.
+    Returns (xs, ys) lists of int coordinates clamped to the screen.
+    """
+    # Power-basis coefficients, evaluated in Horner form: P(t) = P0 + t*(C1 + t*(C2 + t*C3))
+    c1x = 3 * (p1[0] - p0[0])
+    c1y = 3 * (p1[1] - p0[1])
+    c2x = 3 * p0[0] - 6 * p1[0] + 3 * p2[0]
+    c2y = 3 * p0[1] - 6 * p1[1] + 3 * p2[1]
+    c3x = -p0[0] + 3 * p1[0] - 3 * p2[0] + p3[0]
+    c3y = -p0[1] + 3 * p1[1] - 3 * p2[1] + p3[1]
+    x0, y0 = p0
+    if _sample_bezier is not None and _W is not None:
+        xs, ys = _sample_bezier(float(x0), float(y0), float(c1x), float(c1y), float(c2x), float(c2y),
+                                float(c3x), float(c3y), int(steps), int(_W), int(_H))
+        return xs.tolist(), ys.tolist()
+    if np is not None:
+        t = np.linspace(1 / steps, 1, steps)
+        xs = (x0 + t * (c1x + t * (c2x + t * c3x))).astype(np.int64)
+        ys = (y0 + t * (c1y + t * (c2y + t * c3y))).astype(np.int64)
+        if _W is not None:
+            # Clamp the whole path in one call instead of per step
+            np.clip(xs, 0, _W - 1, out=xs)
+            np.clip(ys, 0, _H - 1, out=ys)
+        return xs.tolist(), ys.tolist()
+    xs, ys = [], []
     for i in range(1, steps + 1):
         t = i / steps
-        nx, ny = bezier((sx, sy), c1, c2, (ex, ey), t)
-        nx, ny = clamp_to_screen(nx, ny)
-        pyautogui.moveTo(nx, ny)
-        time.sleep(step_duration)
+        cx, cy = clamp_to_screen(x0 + t * (c1x + t * (c2x + t * c3x)),
+                                 y0 + t * (c1y + t * (c2y + t * c3y)))
+        xs.append(int(cx))
+        ys.append(int(cy))
+    return xs, ys
 
 def mouse_down(button='left'):
     if not pyautogui:
@@ -361,11 +474,16 @@ def type_text_human(text, min_interval=0.01, max_interval=0.05):
     if not _controller:
         print("pynput is not available. Cannot type text.")
         return
-    import random
-    for char in str(text):
-        _controller.press(char)
-        _controller.release(char)
-        time.sleep(random.uniform(min_interval, max_interval))
+    text = str(text)
+    if np is not None:
+        # All delays drawn in one call instead of one random.uniform per char
+        delays = np.random.uniform(min_interval, max_interval, len(text)).tolist()
+    else:
+        import random
+        delays = [random.uniform(min_interval, max_interval) for _ in text]
+    for char, delay in zip(text, delays):
+        _controller.type(char)
+        time.sleep(delay)
 
 def hotkey_sequence(sequences, interval=0.1):
     """Execute multiple hotkey combinations in order: [['ctrl','c'], ['ctrl','v']]."""
@@ -412,14 +530,9 @@ def wait_for_key(target_key=None, timeout=None):
 
     listener = pynput_keyboard.Listener(on_press=on_press)
     listener.start()
-
-    start = time.time()
-    while listener.running:
-        if pressed['val'] is not None and (tk is None or pressed['val'].lower() == tk):
-            break
-        if timeout is not None and (time.time() - start) > float(timeout):
-            listener.stop()
-            return None
-        time.sleep(0.01)
-    listener.stop()
+    # on_press returns False on a match, which stops the listener and ends join()
+    listener.join(None if timeout is None else float(timeout))
+    if listener.is_alive():
+        listener.stop()
+        return None
     return pressed['val']
\ No newline at end of file
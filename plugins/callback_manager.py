@@ -31,9 +31,9 @@ class CallbackManager:
         """Виконує AML функцію за її ID з переданими аргументами."""
         if args is None:
             args = []
-            
-        with self._lock:
-            callback = self._callbacks.get(cb_id)
+
+        # Читання dict атомарне під GIL; лок потрібен лише для змін у register/unregister
+        callback = self._callbacks.get(cb_id)
             
         if not callback:
             return None
@@ -55,9 +55,7 @@ class CallbackManager:
 
     def execute_all(self, args=None):
         """Виконує всі зареєстровані колбеки."""
-        ids = []
-        with self._lock:
-            ids = list(self._callbacks.keys())
+        ids = list(self._callbacks)
             
         results = []
         for cb_id in ids:
@@ -8,15 +8,56 @@ def to_str(value):
         return ""
     return str(value)
 
+def _str_to_int(value, default):
+    if not value.strip():
+        return default
+    return int(float(value)) # Handles '1.0' as well
+
+def _str_to_float(value, default):
+    if not value.strip():
+        return default
+    return float(value)
+
+# Поширені написання перевіряються без .lower()/.strip() (жодних нових рядків)
+_TRUE_STRINGS = frozenset({'true', '1', 'yes', 'on', 'True', 'TRUE', 'Yes', 'YES', 'On', 'ON'})
+_FALSE_STRINGS = frozenset({'false', '0', 'no', 'off', 'False', 'FALSE', 'No', 'NO', 'Off', 'OFF'})
+
+def _str_to_bool(value):
+    if value in _TRUE_STRINGS: return True
+    if value in _FALSE_STRINGS: return False
+    v = value.lower().strip()
+    if v in ('true', '1', 'yes', 'on'): return True
+    if v in ('false', '0', 'no', 'off'): return False
+    return bool(v)
+
+# Таблиці обробників за точним типом: один пошук у dict замість ланцюжка isinstance
+_INT_DISPATCH = {
+    int: lambda v, d: v,
+    bool: lambda v, d: int(v),
+    float: lambda v, d: int(v),
+    str: _str_to_int,
+}
+
+_FLOAT_DISPATCH = {
+    float: lambda v, d: v,
+    int: lambda v, d: float(v),
+    bool: lambda v, d: float(v),
+    str: _str_to_float,
+}
+
+_BOOL_DISPATCH = {
+    bool: lambda v: v,
+    str: _str_to_bool,
+}
+
 def to_int(value, default=0):
     """Перетворити значення в ціле число. Повертає default при помилці."""
     try:
-        if isinstance(value, float):
-            return int(value)
+        fn = _INT_DISPATCH.get(type(value))
+        if fn is not None:
+            return fn(value, default)
         if isinstance(value, str):
-            if not value.strip():
-                return default
-            return int(float(value)) # Handles '1.0' as well
+            return _str_to_int(value, default)
         return int(value)
     except (ValueError, TypeError):
         return default
@@ -24,8 +65,11 @@ def to_int(value, default=0):
 def to_float(value, default=0.0):
     """Перетворити значення в число з плаваючою комою. Повертає default при помилці."""
     try:
-        if isinstance(value, str) and not value.strip():
-            return default
+        fn = _FLOAT_DISPATCH.get(type(value))
+        if fn is not None:
+            return fn(value, default)
+        if isinstance(value, str):
+            return _str_to_float(value, default)
         return float(value)
     except (ValueError, TypeError):
         return default
@@ -36,13 +80,11 @@ def to_bool(value):
     Рядки 'true', '1', 'yes', 'on' вважаються True.
     Рядки 'false', '0', 'no', 'off' вважаються False.
     """
-    if isinstance(value, bool):
-        return value
+    fn = _BOOL_DISPATCH.get(type(value))
+    if fn is not None:
+        return fn(value)
     if isinstance(value, str):
-        v = value.lower().strip()
-        if v in ('true', '1', 'yes', 'on'): return True
-        if v in ('false', '0', 'no', 'off'): return False
-        return bool(v)
+        return _str_to_bool(value)
     return bool(value)
 
 def to_list(value):
@@ -55,6 +97,9 @@ def to_list(value):
         return []
     return [value]
 
+# Точні типи скалярів, які повертаються без змін (перевірка за type(), без isinstance)
+_SCALARS = frozenset({type(None), bool, int, float, str})
+
 def to_aml(value):
     """
     Рекурсивно перетворює типи Python в типи, прийнятні для AML.
@@ -63,14 +108,20 @@ def to_aml(value):
     - bytes -> string (hex)
     - datetime -> string (ISO format)
     """
-    if value is None or isinstance(value, (bool, int, float, str)):
+    if type(value) in _SCALARS:
+        return value
+
+    if isinstance(value, (bool, int, float, str)):
         return value
     
     if isinstance(value, (list, tuple, set, range)):
         return [to_aml(item) for item in value]
     
     if isinstance(value, dict):
-        return {str(k): to_aml(v) for k, v in value.items()}
+        out = {}
+        for k, v in value.items():
+            out[k if type(k) is str else str(k)] = to_aml(v)
+        return out
     
     if isinstance(value, complex):
         return {"real": value.real, "imag": value.imag}
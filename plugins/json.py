@@ -3,21 +3,89 @@ JSON модуль для AML: парсинг та серіалізація.
 """
 
 import json
+import math
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson вміє лише UTF-8 та відступ у 2 пробіли; решта випадків іде через stdlib json
+_ORJSON_ENCODINGS = ('utf-8', 'utf8')
+
+# Цілі ширші за 64 біти orjson перетворює на float, тож такий текст одразу йде в stdlib
+_WIDE_INT = re.compile(r'\d{19,}')
+_WIDE_INT_BYTES = re.compile(rb'\d{19,}')
+
+# Великий буфер для write_json, щоб json.dump не робив багато дрібних записів
+_WRITE_BUFFER = 1 << 20
+
+def _loads(data):
+    """Розпарсити str або bytes; stdlib підхоплює все, що orjson читає інакше або не читає."""
+    if orjson is not None:
+        wide = _WIDE_INT_BYTES if isinstance(data, (bytes, bytearray)) else _WIDE_INT
+        if not wide.search(data):
+            try:
+                return orjson.loads(data)
+            except Exception:
+                # NaN, Infinity, одиничні сурогати тощо
+                pass
+    return json.loads(data)
+
+def _orjson_safe(obj):
+    """Чи дасть orjson для obj той самий текст, що й json.dumps(indent=2)."""
+    kind = type(obj)
+    if kind is str or kind is bool or obj is None:
+        return True
+    if kind is int:
+        return -2 ** 63 <= obj < 2 ** 64
+    if kind is float:
+        # Нескінченності та NaN stdlib пише як Infinity/NaN, а експоненту — інакше, ніж orjson
+        return math.isfinite(obj) and 'e' not in repr(obj)
+    if kind is list or kind is tuple:
+        return all(_orjson_safe(item) for item in obj)
+    if kind is dict:
+        return all(type(key) is str and _orjson_safe(value) for key, value in obj.items())
+    return False
+
+def _dumps_bytes(obj, indent, ensure_ascii):
+    """Серіалізувати через orjson у bytes; None, якщо результат відрізнявся б від stdlib."""
+    # Без відступу stdlib ставить роздільники ", " та ": ", яких orjson не має
+    if orjson is None or ensure_ascii or indent != 2 or not _orjson_safe(obj):
+        return None
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    except TypeError:
+        # Наприклад, одиничний сурогат або надто глибока вкладеність
+        return None
 
 def parse(text):
     """Розпарсити JSON-рядок у Python-об'єкт."""
-    return json.loads(text)
+    return _loads(text)
 
 def stringify(obj, indent=None, ensure_ascii=False):
     """Перетворити Python-об'єкт у JSON-рядок."""
+    data = _dumps_bytes(obj, indent, ensure_ascii)
+    if data is not None:
+        return data.decode('utf-8')
     return json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii)
 
 def read_json(path, encoding='utf-8'):
     """Прочитати JSON-файл та повернути Python-об'єкт."""
+    if orjson is not None and encoding.lower() in _ORJSON_ENCODINGS:
+        with open(path, 'rb') as f:
+            return _loads(f.read())
     with open(path, 'r', encoding=encoding) as f:
         return json.load(f)
 
 def write_json(path, obj, indent=2, ensure_ascii=False, encoding='utf-8'):
     """Записати Python-об'єкт у JSON-файл."""
-    with open(path, 'w', encoding=encoding) as f:
-        json.dump(obj, f, indent=indent, ensure_ascii=ensure_ascii)
\ No newline at end of file
+    if encoding.lower() in _ORJSON_ENCODINGS:
+        data = _dumps_bytes(obj, indent, ensure_ascii)
+        if data is not None:
+            with open(path, 'wb', buffering=_WRITE_BUFFER) as f:
+                f.write(data)
+            return
+    with open(path, 'w', encoding=encoding, buffering=_WRITE_BUFFER) as f:
+        json.dump(obj, f, indent=indent, ensure_ascii=ensure_ascii)
@@ -4,10 +4,36 @@
 import os
 import sys
 
+def _enable_vt():
+    """Увімкнути обробку ANSI-послідовностей у консолі Windows. Повертає True, якщо вони підтримуються."""
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+_VT_ENABLED = _enable_vt()
+
 def log(*args, sep=' ', end='\n'):
     """Вивести одне або кілька значень у консоль."""
-    print(*args, sep=sep, end=end)
-    sys.stdout.flush()
+    out = sys.stdout
+    out.write(sep.join(map(str, args)) + end)
+    out.flush()
+
+def log_many(lines):
+    """Вивести список рядків у консоль одним записом."""
+    out = sys.stdout
+    out.write('\n'.join(map(str, lines)) + '\n')
+    out.flush()
 
 def print_line(*args):
     """Вивести рядок у консоль (аліас для log)."""
@@ -26,33 +52,40 @@ def read(prompt=""):
 
 def clear():
     """Очистити екран консолі."""
-    if os.name == 'nt':
-        os.system('cls')
-    else:
-        os.system('clear')
+    if not _VT_ENABLED:
+        os.system('cls' if os.name == 'nt' else 'clear')
+        return
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
 def set_title(title):
     """Встановити заголовок вікна консолі."""
-    if os.name == 'nt':
+    if not _VT_ENABLED:
         os.system(f'title {title}')
-    else:
-        sys.stdout.write(f"\x1b]2;{title}\x07")
-        sys.stdout.flush()
+        return
+    sys.stdout.write(f"\x1b]0;{title}\x07")
+    sys.stdout.flush()
+
+# Готові ANSI-префікси для color_log
+_COLOR_PREFIX = {
+    "red": "\033[31m",
+    "green": "\033[32m",
+    "yellow": "\033[33m",
+    "blue": "\033[34m",
+    "magenta": "\033[35m",
+    "cyan": "\033[36m",
+    "white": "\033[37m"
+}
+_RESET = "\033[0m"
 
 def color_log(text, color="white"):
     """
     Вивести кольоровий текст у консоль.
     Підтримувані кольори: red, green, yellow, blue, magenta, cyan, white.
     """
-    colors = {
-        "red": "31",
-        "green": "32",
-        "yellow": "33",
-        "blue": "34",
-        "magenta": "35",
-        "cyan": "36",
-        "white": "37"
-    }
-    code = colors.get(color.lower(), "37")
-    print(f"\033[{code}m{text}\033[0m")
-    sys.stdout.flush()
+    out = sys.stdout
+    out.write(_COLOR_PREFIX.get(color.lower(), "\033[37m"))
+    out.write(str(text))
+    out.write(_RESET)
+    out.write('\n')
+    out.flush()
@@ -8,14 +8,15 @@ from .windows import (
 from .input import (
     get_mouse_pos, set_mouse_pos, mouse_move_to, 
     click, mouse_scroll, key_down, key_up, 
-    key_press, hotkey, type_text, get_pixel_color,
+    key_press, hotkey, type_text, get_pixel_color, get_pixel_colors,
     get_screen_size, clamp_to_screen, move_mouse_relative_smooth,
     move_mouse_to_ratio, move_mouse_bezier_to, double_click,
     mouse_down, mouse_up, drag_to_smooth, scroll_smooth,
-    type_text_human, wait_for_key
+    type_text_human, wait_for_key, invalidate_screen_size
 )
 from .system import (
     sleep, beep, set_brightness, get_brightness,
     set_volume, get_volume, monitor_on, monitor_off,
-    set_keyboard_layout, get_keyboard_layout
+    set_keyboard_layout, get_keyboard_layout, invalidate_monitor_cache,
+    set_keyboard_layout_broadcast
 )
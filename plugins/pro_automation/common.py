@@ -1,6 +1,8 @@
 import ctypes
 from ctypes import wintypes
 import platform
+import threading
+import time
 
 # Constants for Windows API
 GWL_STYLE = -16
@@ -16,6 +18,15 @@ MOD_SHIFT = 0x0004
 MOD_WIN = 0x0008
 WM_HOTKEY = 0x0312
 
+# Message wait constants
+INFINITE = 0xFFFFFFFF
+QS_ALLINPUT = 0x04FF
+MWMO_INPUTAVAILABLE = 0x0004
+
+# High-resolution waitable timer (Windows 10 1803+)
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x1F0003
+
 # Virtual Key Codes
 VK_LBUTTON = 0x01
 VK_RBUTTON = 0x02
@@ -48,6 +59,22 @@ MOUSEEVENTF_LEFTUP = 0x0004
 MOUSEEVENTF_RIGHTDOWN = 0x0008
 MOUSEEVENTF_RIGHTUP = 0x0010
 MOUSEEVENTF_WHEEL = 0x0800
+MOUSEEVENTF_HWHEEL = 0x1000
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_ABSOLUTE = 0x8000
+MOUSEEVENTF_VIRTUALDESK = 0x4000
+
+# GetSystemMetrics: bounds of the virtual screen (all monitors)
+SM_XVIRTUALSCREEN = 76
+SM_YVIRTUALSCREEN = 77
+SM_CXVIRTUALSCREEN = 78
+SM_CYVIRTUALSCREEN = 79
+
+# SendInput constants
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
 
 # Window Message Constants
 WM_CLOSE = 0x0010
@@ -59,15 +86,54 @@ user32 = None
 kernel32 = None
 gdi32 = None
 dxva2 = None
+winmm = None
 
 if platform.system() == "Windows":
-    user32 = ctypes.windll.user32
-    kernel32 = ctypes.windll.kernel32
-    gdi32 = ctypes.windll.gdi32
+    # Private WinDLL instances: the prototypes declared below do not leak into ctypes.windll users
+    user32 = ctypes.WinDLL('user32')
+    kernel32 = ctypes.WinDLL('kernel32')
+    gdi32 = ctypes.WinDLL('gdi32')
     try:
-        dxva2 = ctypes.windll.dxva2
+        dxva2 = ctypes.WinDLL('dxva2')
     except Exception:
         dxva2 = None
+    try:
+        winmm = ctypes.WinDLL('winmm')
+    except Exception:
+        winmm = None
+
+# One timer per thread: a waitable timer cannot be armed by two waiters at once
+_timer_local = threading.local()
+
+def _hr_timer():
+    handle = getattr(_timer_local, 'handle', None)
+    if handle is None:
+        kernel32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+        handle = kernel32.CreateWaitableTimerExW(None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION,
+                                                 TIMER_ALL_ACCESS) or 0
+        _timer_local.handle = handle
+    return handle
+
+def normalize_absolute(v, origin, size):
+    """
+    Map pixel coordinate v on an axis spanning [origin, origin + size) to SendInput's 0..65535 range.
+    Windows maps back with (n * size) >> 16, so the pixel centre is targeted to land exactly on v.
+    """
+    n = ((2 * (int(v) - origin) + 1) << 16) // (2 * size)
+    return 0 if n < 0 else 65535 if n > 65535 else n
+
+def precise_sleep(seconds):
+    """Sleep with ~1 ms resolution on Windows (high-resolution waitable timer); time.sleep elsewhere."""
+    if seconds <= 0:
+        return
+    handle = _hr_timer() if kernel32 else 0
+    if handle:
+        # Negative due time = relative interval in 100 ns units
+        due = ctypes.c_int64(-int(seconds * 10_000_000))
+        if kernel32.SetWaitableTimer(wintypes.HANDLE(handle), ctypes.byref(due), 0, None, None, False):
+            kernel32.WaitForSingleObject(wintypes.HANDLE(handle), INFINITE)
+            return
+    time.sleep(seconds)
 
 class PHYSICAL_MONITOR(ctypes.Structure):
     _fields_ = [("hPhysicalMonitor", wintypes.HANDLE),
@@ -78,3 +144,132 @@ WM_INPUTLANGCHANGEREQUEST = 0x0050
 
 class POINT(ctypes.Structure):
     _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+
+# Raw Input constants and structures
+WM_INPUT = 0x00FF
+WM_KEYDOWN = 0x0100
+WM_SYSKEYDOWN = 0x0104
+RID_INPUT = 0x10000003
+RIM_TYPEKEYBOARD = 1
+RIDEV_REMOVE = 0x00000001
+RIDEV_INPUTSINK = 0x00000100
+RI_KEY_E0 = 0x02
+MAPVK_VK_TO_CHAR = 2
+
+class RAWINPUTDEVICE(ctypes.Structure):
+    _fields_ = [("usUsagePage", wintypes.USHORT),
+                ("usUsage", wintypes.USHORT),
+                ("dwFlags", wintypes.DWORD),
+                ("hwndTarget", wintypes.HWND)]
+
+class RAWINPUTHEADER(ctypes.Structure):
+    _fields_ = [("dwType", wintypes.DWORD),
+                ("dwSize", wintypes.DWORD),
+                ("hDevice", wintypes.HANDLE),
+                ("wParam", wintypes.WPARAM)]
+
+class RAWKEYBOARD(ctypes.Structure):
+    _fields_ = [("MakeCode", wintypes.USHORT),
+                ("Flags", wintypes.USHORT),
+                ("Reserved", wintypes.USHORT),
+                ("VKey", wintypes.USHORT),
+                ("Message", wintypes.UINT),
+                ("ExtraInformation", wintypes.ULONG)]
+
+class RAWINPUT_KEYBOARD(ctypes.Structure):
+    _fields_ = [("header", RAWINPUTHEADER), ("keyboard", RAWKEYBOARD)]
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t)]
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", wintypes.WORD),
+                ("wScan", wintypes.WORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t)]
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [("uMsg", wintypes.DWORD),
+                ("wParamL", wintypes.WORD),
+                ("wParamH", wintypes.WORD)]
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+# GDI constants and structures for screen capture
+SRCCOPY = 0x00CC0020
+DIB_RGB_COLORS = 0
+BI_RGB = 0
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [("biSize", wintypes.DWORD),
+                ("biWidth", wintypes.LONG),
+                ("biHeight", wintypes.LONG),
+                ("biPlanes", wintypes.WORD),
+                ("biBitCount", wintypes.WORD),
+                ("biCompression", wintypes.DWORD),
+                ("biSizeImage", wintypes.DWORD),
+                ("biXPelsPerMeter", wintypes.LONG),
+                ("biYPelsPerMeter", wintypes.LONG),
+                ("biClrUsed", wintypes.DWORD),
+                ("biClrImportant", wintypes.DWORD)]
+
+class BITMAPINFO(ctypes.Structure):
+    _fields_ = [("bmiHeader", BITMAPINFOHEADER), ("bmiColors", wintypes.DWORD * 1)]
+
+def _declare(fn, restype, *argtypes):
+    fn.argtypes = list(argtypes)
+    fn.restype = restype
+
+def _declare_prototypes():
+    """Declare argtypes/restype once so ctypes skips per-call argument type inference."""
+    W = wintypes
+    _declare(user32.SetCursorPos, W.BOOL, ctypes.c_int, ctypes.c_int)
+    _declare(user32.GetCursorPos, W.BOOL, ctypes.POINTER(POINT))
+    _declare(user32.GetSystemMetrics, ctypes.c_int, ctypes.c_int)
+    _declare(user32.mouse_event, None, W.DWORD, W.DWORD, W.DWORD, W.DWORD, ctypes.c_size_t)
+    _declare(user32.keybd_event, None, ctypes.c_ubyte, ctypes.c_ubyte, W.DWORD, ctypes.c_size_t)
+    _declare(user32.SendInput, W.UINT, W.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+    _declare(user32.PostMessageW, W.BOOL, W.HWND, W.UINT, W.WPARAM, W.LPARAM)
+    _declare(user32.SendMessageW, W.LPARAM, W.HWND, W.UINT, W.WPARAM, W.LPARAM)
+    _declare(user32.SendNotifyMessageW, W.BOOL, W.HWND, W.UINT, W.WPARAM, W.LPARAM)
+    _declare(user32.LoadKeyboardLayoutW, W.HKL, W.LPCWSTR, W.UINT)
+    _declare(user32.ActivateKeyboardLayout, W.HKL, W.HKL, W.UINT)
+    _declare(user32.GetDC, W.HDC, W.HWND)
+    _declare(user32.ReleaseDC, ctypes.c_int, W.HWND, W.HDC)
+    _declare(gdi32.GetPixel, W.DWORD, W.HDC, ctypes.c_int, ctypes.c_int)
+    _declare(gdi32.CreateCompatibleDC, W.HDC, W.HDC)
+    _declare(gdi32.CreateDIBSection, W.HBITMAP, W.HDC, ctypes.POINTER(BITMAPINFO), W.UINT,
+             ctypes.POINTER(ctypes.c_void_p), W.HANDLE, W.DWORD)
+    _declare(gdi32.SelectObject, W.HGDIOBJ, W.HDC, W.HGDIOBJ)
+    _declare(gdi32.BitBlt, W.BOOL, W.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+             W.HDC, ctypes.c_int, ctypes.c_int, W.DWORD)
+    _declare(gdi32.GdiFlush, W.BOOL)
+    _declare(gdi32.DeleteObject, W.BOOL, W.HGDIOBJ)
+    _declare(gdi32.DeleteDC, W.BOOL, W.HDC)
+    _declare(user32.CreateWindowExW, W.HWND, W.DWORD, W.LPCWSTR, W.LPCWSTR, W.DWORD, ctypes.c_int, ctypes.c_int,
+             ctypes.c_int, ctypes.c_int, W.HWND, W.HMENU, W.HINSTANCE, W.LPVOID)
+    _declare(user32.DestroyWindow, W.BOOL, W.HWND)
+    _declare(user32.RegisterRawInputDevices, W.BOOL, ctypes.POINTER(RAWINPUTDEVICE), W.UINT, W.UINT)
+    _declare(user32.GetRawInputData, W.UINT, W.HANDLE, W.UINT, W.LPVOID, ctypes.POINTER(W.UINT), W.UINT)
+    _declare(user32.MapVirtualKeyW, W.UINT, W.UINT, W.UINT)
+    if dxva2:
+        LPPM = ctypes.POINTER(PHYSICAL_MONITOR)
+        _declare(dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR, W.BOOL, W.HMONITOR, W.LPDWORD)
+        _declare(dxva2.GetPhysicalMonitorsFromHMONITOR, W.BOOL, W.HMONITOR, W.DWORD, LPPM)
+        _declare(dxva2.DestroyPhysicalMonitors, W.BOOL, W.DWORD, LPPM)
+        _declare(dxva2.SetMonitorBrightness, W.BOOL, W.HANDLE, W.DWORD)
+        _declare(dxva2.GetMonitorBrightness, W.BOOL, W.HANDLE, W.LPDWORD, W.LPDWORD, W.LPDWORD)
+
+if user32:
+    _declare_prototypes()
@@ -1,16 +1,43 @@
 import threading
 import time
 import ctypes
+from collections import deque
 from ctypes import wintypes
 import aml_runtime_access
-from .common import user32, MOD_CONTROL, MOD_ALT, MOD_SHIFT, MOD_WIN, WM_HOTKEY, \
-                    VK_SPACE, VK_RETURN, VK_TAB, VK_ESCAPE
+from .common import user32, kernel32, MOD_CONTROL, MOD_ALT, MOD_SHIFT, MOD_WIN, WM_HOTKEY, \
+                    VK_SPACE, VK_RETURN, VK_TAB, VK_ESCAPE, INFINITE, QS_ALLINPUT, MWMO_INPUTAVAILABLE
+
+class _HK:
+    __slots__ = ('modifiers', 'vk', 'callback', 'str')
+
+    def __init__(self, modifiers, vk, callback, hotkey_str):
+        self.modifiers = modifiers
+        self.vk = vk
+        self.callback = callback
+        self.str = hotkey_str
 
 _hotkeys = {}
 _hotkey_thread = None
 _next_hotkey_id = 1
-_hotkey_cmd_queue = []
+_hotkey_cmd_queue = deque()
 _hotkey_cmd_lock = threading.Lock()
+# Auto-reset event that wakes the hotkey thread when a command is queued
+_hotkey_cmd_event = None
+
+def _wake_hotkey_loop():
+    if _hotkey_cmd_event:
+        kernel32.SetEvent(_hotkey_cmd_event)
+
+def _create_cmd_event():
+    global _hotkey_cmd_event
+    if not kernel32:
+        return
+    kernel32.CreateEventW.restype = wintypes.HANDLE
+    handle = kernel32.CreateEventW(None, False, False, None)
+    if handle:
+        _hotkey_cmd_event = wintypes.HANDLE(handle)
+
+_create_cmd_event()
 
 def _hotkey_loop():
     msg = wintypes.MSG()
@@ -18,7 +45,7 @@ def _hotkey_loop():
         # Check for new registration commands
         with _hotkey_cmd_lock:
             while _hotkey_cmd_queue:
-                cmd = _hotkey_cmd_queue.pop(0)
+                cmd = _hotkey_cmd_queue.popleft()
                 if cmd['type'] == 'register':
                     id, modifiers, vk = cmd['id'], cmd['modifiers'], cmd['vk']
                     if user32.RegisterHotKey(None, id, modifiers, vk):
@@ -28,12 +55,13 @@ def _hotkey_loop():
                 elif cmd['type'] == 'unregister':
                     user32.UnregisterHotKey(None, cmd['id'])
         
-        # Peek message
-        if user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, 1): # 1 is PM_REMOVE
+        # Drain pending messages
+        while user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, 1): # 1 is PM_REMOVE
             if msg.message == WM_HOTKEY:
                 id = msg.wParam
-                if id in _hotkeys:
-                    callback = _hotkeys[id]['callback']
+                hk = _hotkeys.get(id)
+                if hk is not None:
+                    callback = hk.callback
                     interpreter = aml_runtime_access.get_interpreter()
                     if interpreter and callback:
                         try:
@@ -45,6 +73,11 @@ def _hotkey_loop():
                             print(f"Error in hotkey callback: {e}")
             user32.TranslateMessage(ctypes.byref(msg))
             user32.DispatchMessageW(ctypes.byref(msg))
+
+        # Sleep until a message arrives or a command is queued
+        if _hotkey_cmd_event:
+            user32.MsgWaitForMultipleObjectsEx(1, ctypes.byref(_hotkey_cmd_event), INFINITE,
+                                               QS_ALLINPUT, MWMO_INPUTAVAILABLE)
         else:
             time.sleep(0.01)
 
@@ -77,11 +110,13 @@ def register_hotkey(hotkey_str, callback):
         
     id = _next_hotkey_id
     _next_hotkey_id += 1
-    _hotkeys[id] = {'modifiers': modifiers, 'vk': vk, 'callback': callback, 'str': hotkey_str}
+    _hotkeys[id] = _HK(modifiers, vk, callback, hotkey_str)
     
     with _hotkey_cmd_lock:
         _hotkey_cmd_queue.append({'type': 'register', 'id': id, 'modifiers': modifiers, 'vk': vk})
         
+    _wake_hotkey_loop()
+
     if _hotkey_thread is None:
         _hotkey_thread = threading.Thread(target=_hotkey_loop, daemon=True)
         _hotkey_thread.start()
@@ -93,6 +128,7 @@ def unregister_hotkey(id):
     if id in _hotkeys:
         with _hotkey_cmd_lock:
             _hotkey_cmd_queue.append({'type': 'unregister', 'id': id})
+        _wake_hotkey_loop()
         del _hotkeys[id]
         return True
     return False
@@ -1,13 +1,21 @@
 import ctypes
+from ctypes import wintypes
 import time
 import math
 import random
+import threading
+from functools import lru_cache
 
 try:
     import pyautogui
 except ImportError:
     pyautogui = None
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 try:
     from pynput import keyboard as pynput_keyboard
     from pynput.keyboard import Controller, Key
@@ -17,17 +25,54 @@ except Exception:
     _controller = None
     Key = None
 
-from .common import user32, gdi32, POINT, MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP, \
-                    MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP, MOUSEEVENTF_WHEEL
-
-def get_screen_size():
-    """Returns the screen size as a (width, height) tuple."""
-    if pyautogui:
-        return pyautogui.size()
+from .common import user32, gdi32, winmm, precise_sleep, POINT, INPUT, INPUT_MOUSE, MOUSEEVENTF_LEFTDOWN, \
+                    MOUSEEVENTF_LEFTUP, MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP, MOUSEEVENTF_WHEEL, MOUSEEVENTF_HWHEEL, \
+                    MOUSEEVENTF_MOVE, MOUSEEVENTF_ABSOLUTE, MOUSEEVENTF_VIRTUALDESK, normalize_absolute, \
+                    SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN, SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN, INPUT_KEYBOARD, KEYEVENTF_KEYUP, KEYEVENTF_UNICODE, \
+                    BITMAPINFO, BITMAPINFOHEADER, SRCCOPY, DIB_RGB_COLORS, BI_RGB, \
+                    RAWINPUTDEVICE, RAWINPUTHEADER, RAWINPUT_KEYBOARD, WM_INPUT, WM_KEYDOWN, WM_SYSKEYDOWN, \
+                    RID_INPUT, RIM_TYPEKEYBOARD, RIDEV_REMOVE, RIDEV_INPUTSINK, RI_KEY_E0, MAPVK_VK_TO_CHAR, \
+                    INFINITE, QS_ALLINPUT, MWMO_INPUTAVAILABLE
+
+# Screen size cache: re-read at most once per _SCREEN_TTL seconds
+_SCREEN_TTL = 1.0
+_screen_cache = {'wh': None, 'ts': 0.0, 'virtual': None, 'vts': 0.0}
+
+def _query_screen_size():
+    # user32 first: GetSystemMetrics is a plain call, pyautogui may probe the display
     if user32:
         return (user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
+    if pyautogui:
+        w, h = pyautogui.size()
+        return (int(w), int(h))
     return (0, 0)
 
+def get_screen_size():
+    """Returns the screen size as a (width, height) tuple."""
+    now = time.monotonic()
+    wh = _screen_cache['wh']
+    if wh is None or now - _screen_cache['ts'] >= _SCREEN_TTL:
+        wh = _query_screen_size()
+        _screen_cache['wh'] = wh
+        _screen_cache['ts'] = now
+    return wh
+
+def _virtual_screen():
+    """(left, top, width, height) of the virtual screen spanning all monitors, cached like the screen size."""
+    now = time.monotonic()
+    vs = _screen_cache['virtual']
+    if vs is None or now - _screen_cache['vts'] >= _SCREEN_TTL:
+        vs = (user32.GetSystemMetrics(SM_XVIRTUALSCREEN), user32.GetSystemMetrics(SM_YVIRTUALSCREEN),
+              user32.GetSystemMetrics(SM_CXVIRTUALSCREEN), user32.GetSystemMetrics(SM_CYVIRTUALSCREEN))
+        _screen_cache['virtual'] = vs
+        _screen_cache['vts'] = now
+    return vs
+
+def invalidate_screen_size():
+    """Drop the cached screen size so the next call re-reads it (e.g. after a display change)."""
+    _screen_cache['wh'] = None
+    _screen_cache['virtual'] = None
+
 def get_mouse_pos():
     if not user32: return (0, 0)
     pt = POINT()
@@ -37,18 +82,98 @@ def get_mouse_pos():
 def set_mouse_pos(x, y):
     return user32.SetCursorPos(int(x), int(y)) if user32 else False
 
+def _build_move_inputs(points):
+    """Build a ctypes INPUT array of absolute mouse moves for the given (x, y) points, or None."""
+    if not user32 or not hasattr(user32, 'SendInput'):
+        return None
+    left, top, w, h = _virtual_screen()
+    if w <= 1 or h <= 1:
+        return None
+    # Absolute coordinates are normalized over the virtual desktop, so secondary monitors
+    # and negative coordinates work like they do with SetCursorPos
+    flags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK
+    arr = (INPUT * len(points))()
+    for item, (x, y) in zip(arr, points):
+        item.type = INPUT_MOUSE
+        item.mi.dx = normalize_absolute(x, left, w)
+        item.mi.dy = normalize_absolute(y, top, h)
+        item.mi.dwFlags = flags
+    return arr
+
+def _play_mouse_path(points, duration):
+    """
+    Move the cursor through the points over `duration` seconds.
+    Moves go through SendInput (one batched call when duration is 0) and fall back to SetCursorPos.
+    Steps are paced against absolute deadlines so sleep overshoot does not accumulate.
+    """
+    n = len(points)
+    if n == 0:
+        return
+    arr = _build_move_inputs(points)
+    size = ctypes.sizeof(INPUT)
+    if arr is not None and duration <= 0:
+        user32.SendInput(n, arr, size)
+        return
+
+    step_duration = duration / n
+    # 1 ms timer resolution for the duration of the movement
+    if winmm: winmm.timeBeginPeriod(1)
+    try:
+        t0 = time.perf_counter()
+        for i in range(n):
+            if arr is not None:
+                user32.SendInput(1, ctypes.byref(arr[i]), size)
+            else:
+                set_mouse_pos(*points[i])
+            remaining = t0 + (i + 1) * step_duration - time.perf_counter()
+            if remaining > 0:
+                precise_sleep(remaining)
+    finally:
+        if winmm: winmm.timeEndPeriod(1)
+
 def clamp_to_screen(x, y):
     """Clamp coordinates to the screen bounds."""
     w, h = get_screen_size()
     if w == 0 or h == 0:
         return (x, y)
-    cx = max(0, min(int(x), int(w) - 1))
-    cy = max(0, min(int(y), int(h) - 1))
+    cx = max(0, min(int(x), w - 1))
+    cy = max(0, min(int(y), h - 1))
     return (cx, cy)
 
-def mouse_move_to(x, y, smooth=False, duration=0.5, steps=20):
+@lru_cache(maxsize=8)
+def _ease_table(steps):
+    """Ease-out progress values for steps 1..steps (same table for every move with this step count)."""
+    table = []
+    for i in range(1, steps + 1):
+        d = 1 - i / steps
+        # Ease-out curve for more natural movement
+        table.append(1 - d * d * d)
+    return tuple(table)
+
+@lru_cache(maxsize=8)
+def _bernstein_table(steps):
+    """Cubic Bernstein weights (b0, b1, b2, b3) at t = 1/steps .. 1; a read-only 4 x steps array with numpy."""
+    rows = []
+    for i in range(1, steps + 1):
+        t = i / steps
+        u = 1 - t
+        rows.append((u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t))
+    if np is None:
+        return tuple(rows)
+    weights = np.array(rows).T
+    weights.flags.writeable = False
+    return weights
+
+def mouse_move_to(x, y, smooth=False, duration=0.5, steps=20, high_fidelity=False):
+    """
+    Moves the cursor to (x, y), optionally along an eased path.
+    Smooth moves use at most one waypoint per 120 Hz frame; apps that need the full curve can read it
+    with GetMouseMovePointsEx. high_fidelity=True keeps every requested step (drawing/painting).
+    """
     if not smooth:
         return set_mouse_pos(x, y)
+    if not high_fidelity:
+        steps = min(steps, max(4, int(duration * 120)))
     
     start_x, start_y = get_mouse_pos()
     dx = x - start_x
@@ -57,18 +182,9 @@ def mouse_move_to(x, y, smooth=False, duration=0.5, steps=20):
     if dx == 0 and dy == 0:
         return True
 
-    step_duration = duration / steps
-
-    for i in range(1, steps + 1):
-        progress = i / steps
-        # Ease-out curve for more natural movement
-        ease_progress = 1 - (1 - progress)**3
-
-        next_x = start_x + dx * ease_progress
-        next_y = start_y + dy * ease_progress
+    points = [(int(start_x + dx * e), int(start_y + dy * e)) for e in _ease_table(steps)]
 
-        set_mouse_pos(next_x, next_y)
-        time.sleep(step_duration)
+    _play_mouse_path(points, duration)
     return True
 
 def move_mouse_relative_smooth(dx, dy, duration=0.5, steps=20):
@@ -101,22 +217,29 @@ def move_mouse_bezier_to(x, y, duration=0.8, steps=40, c1=None, c2=None, jitter=
         c1 = (c1[0] + random.uniform(-jitter, jitter), c1[1] + random.uniform(-jitter, jitter))
         c2 = (c2[0] + random.uniform(-jitter, jitter), c2[1] + random.uniform(-jitter, jitter))
 
-    def bezier(p0, p1, p2, p3, t):
-        u = 1 - t
-        return (
-            u**3 * p0[0] + 3 * u**2 * t * p1[0] + 3 * u * t**2 * p2[0] + t**3 * p3[0],
-            u**3 * p0[1] + 3 * u**2 * t * p1[1] + 3 * u * t**2 * p2[1] + t**3 * p3[1],
-        )
-
-    step_duration = duration / steps
-    for i in range(1, steps + 1):
-        t = i / steps
-        nx, ny = bezier((sx, sy), c1, c2, (ex, ey), t)
-        nx, ny = clamp_to_screen(nx, ny)
-        set_mouse_pos(nx, ny)
-        time.sleep(step_duration)
+    _play_mouse_path(_bezier_points((sx, sy), c1, c2, (ex, ey), steps), duration)
     return True
 
+def _bezier_points(p0, p1, p2, p3, steps):
+    """Sample a cubic Bezier curve at t = 1/steps .. 1 as a list of (x, y) ints clamped to the screen."""
+    weights = _bernstein_table(steps)
+    if np is None:
+        points = []
+        for b0, b1, b2, b3 in weights:
+            points.append(clamp_to_screen(int(b0 * p0[0] + b1 * p1[0] + b2 * p2[0] + b3 * p3[0]),
+                                          int(b0 * p0[1] + b1 * p1[1] + b2 * p2[1] + b3 * p3[1])))
+        return points
+
+    # All steps at once: cached Bernstein weights times the control points
+    b0, b1, b2, b3 = weights
+    xs = (b0 * p0[0] + b1 * p1[0] + b2 * p2[0] + b3 * p3[0]).astype(np.int64)
+    ys = (b0 * p0[1] + b1 * p1[1] + b2 * p2[1] + b3 * p3[1]).astype(np.int64)
+    w, h = get_screen_size()
+    if w and h:
+        np.clip(xs, 0, int(w) - 1, out=xs)
+        np.clip(ys, 0, int(h) - 1, out=ys)
+    return list(zip(xs.tolist(), ys.tolist()))
+
 def click(button="left", x=None, y=None, count=1, interval=0.05, smooth=False, duration=0.2, steps=15):
     if not user32: return False
     
@@ -133,7 +256,7 @@ def click(button="left", x=None, y=None, count=1, interval=0.05, smooth=False, d
         elif button == "right":
             user32.mouse_event(MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
             user32.mouse_event(MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
-        time.sleep(interval)
+        precise_sleep(interval)
     return True
 
 def double_click(x=None, y=None, button='left', smooth=False, duration=0.2, steps=15):
@@ -161,18 +284,32 @@ def drag_to_smooth(x, y, duration=0.5, steps=20, button='left'):
     mouse_up(button)
     return True
 
+def _wheel_flag(direction):
+    return MOUSEEVENTF_WHEEL if direction == 'vertical' else MOUSEEVENTF_HWHEEL
+
 def mouse_scroll(amount, direction='vertical'):
     if not user32: return False
-    if direction == 'vertical':
-        user32.mouse_event(MOUSEEVENTF_WHEEL, 0, 0, int(amount) * 120, 0)
+    user32.mouse_event(_wheel_flag(direction), 0, 0, int(amount) * 120, 0)
     return True
 
 def scroll_smooth(clicks, duration=0.5, steps=10, direction='vertical'):
+    if not user32: return False
     if steps <= 0: steps = 1
-    per = clicks / steps
+    flag = _wheel_flag(direction)
+    total = int(clicks * 120)
+    if duration <= 0:
+        user32.mouse_event(flag, 0, 0, total, 0)
+        return True
+    # Fractional deltas accumulate until they add up to a whole unit; empty frames send nothing
+    per = total / steps
+    accum = 0.0
     for _ in range(steps):
-        mouse_scroll(per, direction)
-        time.sleep(duration / steps)
+        accum += per
+        whole = int(accum)
+        accum -= whole
+        if whole:
+            user32.mouse_event(flag, 0, 0, whole, 0)
+        precise_sleep(duration / steps)
     return True
 
 def key_down(vk):
@@ -181,16 +318,58 @@ def key_down(vk):
 def key_up(vk):
     if user32: user32.keybd_event(int(vk), 0, 2, 0)
 
+def _send_chord(vks):
+    """Press vks in order and release them in reverse with one SendInput call. Returns False if unavailable."""
+    if not user32 or not hasattr(user32, 'SendInput'):
+        return False
+    vks = [int(vk) for vk in vks]
+    n = len(vks)
+    arr = (INPUT * (2 * n))()
+    for i, vk in enumerate(vks + vks[::-1]):
+        item = arr[i]
+        item.type = INPUT_KEYBOARD
+        item.ki.wVk = vk
+        item.ki.dwFlags = KEYEVENTF_KEYUP if i >= n else 0
+    return user32.SendInput(2 * n, arr, ctypes.sizeof(INPUT)) == 2 * n
+
 def key_press(vk):
+    if _send_chord((vk,)): return
     key_down(vk)
     key_up(vk)
 
 def hotkey(*vks):
+    if _send_chord(vks): return
     for vk in vks: key_down(vk)
     for vk in reversed(vks): key_up(vk)
 
+def _build_unicode_inputs(text):
+    """Build a ctypes INPUT array with a KEYEVENTF_UNICODE down/up pair per UTF-16 code unit."""
+    data = str(text).encode('utf-16-le')
+    units = [int.from_bytes(data[i:i + 2], 'little') for i in range(0, len(data), 2)]
+    arr = (INPUT * (2 * len(units)))()
+    for i, unit in enumerate(units):
+        down = arr[2 * i]
+        down.type = INPUT_KEYBOARD
+        down.ki.wScan = unit
+        down.ki.dwFlags = KEYEVENTF_UNICODE
+        up = arr[2 * i + 1]
+        up.type = INPUT_KEYBOARD
+        up.ki.wScan = unit
+        up.ki.dwFlags = KEYEVENTF_UNICODE | KEYEVENTF_KEYUP
+    return arr
+
 def type_text(text, interval=0.01):
-    if _controller:
+    if user32 and hasattr(user32, 'SendInput'):
+        arr = _build_unicode_inputs(text)
+        size = ctypes.sizeof(INPUT)
+        if interval <= 0:
+            # Whole string in one kernel transition
+            user32.SendInput(len(arr), arr, size)
+        else:
+            for i in range(0, len(arr), 2):
+                user32.SendInput(2, ctypes.byref(arr[i]), size)
+                precise_sleep(interval)
+    elif _controller:
         for char in str(text):
             _controller.press(char)
             _controller.release(char)
@@ -204,12 +383,93 @@ def type_text(text, interval=0.01):
 def type_text_human(text, min_interval=0.01, max_interval=0.05):
     for char in str(text):
         type_text(char, 0)
-        time.sleep(random.uniform(min_interval, max_interval))
+        precise_sleep(random.uniform(min_interval, max_interval))
+
+# Virtual-key names matching what the pynput listener reports for special keys
+_RAW_VK_NAMES = {
+    0x08: 'backspace', 0x09: 'tab', 0x0D: 'enter',
+    0x13: 'pause', 0x14: 'caps_lock', 0x1B: 'esc', 0x20: 'space', 0x21: 'page_up', 0x22: 'page_down',
+    0x23: 'end', 0x24: 'home', 0x25: 'left', 0x26: 'up', 0x27: 'right', 0x28: 'down',
+    0x2C: 'print_screen', 0x2D: 'insert', 0x2E: 'delete', 0x5B: 'cmd', 0x5C: 'cmd_r', 0x5D: 'menu',
+    0x90: 'num_lock', 0x91: 'scroll_lock',
+    0xA0: 'shift_l', 0xA1: 'shift_r', 0xA2: 'ctrl_l', 0xA3: 'ctrl_r', 0xA4: 'alt_l', 0xA5: 'alt_r',
+}
+_RAW_VK_NAMES.update({0x70 + i: f'f{i + 1}' for i in range(24)})
+
+# Raw Input reports the generic VK_SHIFT/CONTROL/MENU; pynput reports the left/right key
+_RSHIFT_MAKECODE = 0x36
+_RAW_SIDED_VK = {0x10: (0xA0, 0xA1), 0x11: (0xA2, 0xA3), 0x12: (0xA4, 0xA5)}
+
+# Returned by _wait_for_key_raw when Raw Input cannot be used
+_RAW_UNAVAILABLE = object()
+
+def _raw_vk_to_str(vk, make_code=0, flags=0):
+    sided = _RAW_SIDED_VK.get(vk)
+    if sided:
+        # Right Shift has its own scan code; right Ctrl/Alt carry the E0 prefix
+        right = make_code == _RSHIFT_MAKECODE if vk == 0x10 else bool(flags & RI_KEY_E0)
+        vk = sided[right]
+    name = _RAW_VK_NAMES.get(vk)
+    if name: return name
+    ch = user32.MapVirtualKeyW(vk, MAPVK_VK_TO_CHAR) & 0xFFFF
+    return chr(ch).lower() if ch else str(vk)
+
+def _wait_for_key_raw(tk, timeout):
+    """
+    Wait for a key via Raw Input on a hidden window pumped by this thread (no global keyboard hook).
+    Returns the key string, None on timeout, or _RAW_UNAVAILABLE if Raw Input cannot be set up.
+    """
+    if not user32 or not hasattr(user32, 'RegisterRawInputDevices'):
+        return _RAW_UNAVAILABLE
+    hwnd = user32.CreateWindowExW(0, "STATIC", "", 0, 0, 0, 0, 0, None, None, None, None)
+    if not hwnd:
+        return _RAW_UNAVAILABLE
+    device = RAWINPUTDEVICE(1, 6, RIDEV_INPUTSINK, hwnd)  # Generic desktop / keyboard
+    if not user32.RegisterRawInputDevices(ctypes.byref(device), 1, ctypes.sizeof(RAWINPUTDEVICE)):
+        user32.DestroyWindow(hwnd)
+        return _RAW_UNAVAILABLE
+    try:
+        msg = wintypes.MSG()
+        raw = RAWINPUT_KEYBOARD()
+        header_size = ctypes.sizeof(RAWINPUTHEADER)
+        deadline = None if timeout is None else time.monotonic() + float(timeout)
+        while True:
+            while user32.PeekMessageW(ctypes.byref(msg), wintypes.HWND(hwnd), 0, 0, 1): # 1 is PM_REMOVE
+                if msg.message != WM_INPUT:
+                    user32.DispatchMessageW(ctypes.byref(msg))
+                    continue
+                size = wintypes.UINT(ctypes.sizeof(raw))
+                got = user32.GetRawInputData(msg.lParam, RID_INPUT, ctypes.byref(raw), ctypes.byref(size), header_size)
+                if got in (0, 0xFFFFFFFF) or raw.header.dwType != RIM_TYPEKEYBOARD:
+                    continue
+                if raw.keyboard.Message not in (WM_KEYDOWN, WM_SYSKEYDOWN):
+                    continue
+                val = _raw_vk_to_str(raw.keyboard.VKey, raw.keyboard.MakeCode, raw.keyboard.Flags)
+                if tk is None or val.lower() == tk:
+                    return val
+
+            if deadline is None:
+                wait_ms = INFINITE
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait_ms = int(remaining * 1000) + 1
+            user32.MsgWaitForMultipleObjectsEx(0, None, wait_ms, QS_ALLINPUT, MWMO_INPUTAVAILABLE)
+    finally:
+        device.dwFlags = RIDEV_REMOVE
+        device.hwndTarget = None
+        user32.RegisterRawInputDevices(ctypes.byref(device), 1, ctypes.sizeof(RAWINPUTDEVICE))
+        user32.DestroyWindow(hwnd)
 
 def wait_for_key(target_key=None, timeout=None):
+    tk = str(target_key).lower() if target_key is not None else None
+    result = _wait_for_key_raw(tk, timeout)
+    if result is not _RAW_UNAVAILABLE:
+        return result
+
     if pynput_keyboard is None: return None
     pressed = {'val': None}
-    tk = str(target_key).lower() if target_key is not None else None
 
     def on_press(k):
         val = None
@@ -218,20 +478,17 @@ def wait_for_key(target_key=None, timeout=None):
             elif isinstance(k, pynput_keyboard.Key): val = str(k).replace('Key.', '')
         except Exception: val = str(k)
         pressed['val'] = val
-        if tk is None or (val and val.lower() == tk): return False
+        if tk is None or (val and val.lower() == tk):
+            done.set()
+            return False
         return True
 
+    done = threading.Event()
     listener = pynput_keyboard.Listener(on_press=on_press)
     listener.start()
-    start = time.time()
-    while listener.running:
-        if pressed['val'] is not None and (tk is None or pressed['val'].lower() == tk): break
-        if timeout is not None and (time.time() - start) > float(timeout):
-            listener.stop()
-            return None
-        time.sleep(0.01)
+    matched = done.wait(None if timeout is None else float(timeout))
     listener.stop()
-    return pressed['val']
+    return pressed['val'] if matched else None
 
 def get_pixel_color(x, y):
     if not user32 or not gdi32: return (0, 0, 0)
@@ -239,3 +496,61 @@ def get_pixel_color(x, y):
     pixel = gdi32.GetPixel(hdc, int(x), int(y))
     user32.ReleaseDC(0, hdc)
     return (pixel & 0xff, (pixel >> 8) & 0xff, (pixel >> 16) & 0xff)
+
+def _capture_bgra(bx, by, bw, bh):
+    """Copy a screen rectangle into bytes (top-down rows, 4 bytes per pixel in BGRA order), or None."""
+    hdc = user32.GetDC(None)
+    hdc_mem = hbm = None
+    try:
+        hdc_mem = gdi32.CreateCompatibleDC(hdc)
+        bmi = BITMAPINFO()
+        hdr = bmi.bmiHeader
+        hdr.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        hdr.biWidth = bw
+        hdr.biHeight = -bh  # negative height = top-down rows
+        hdr.biPlanes = 1
+        hdr.biBitCount = 32
+        hdr.biCompression = BI_RGB
+        bits = ctypes.c_void_p()
+        hbm = gdi32.CreateDIBSection(hdc, ctypes.byref(bmi), DIB_RGB_COLORS, ctypes.byref(bits), None, 0)
+        if not hbm or not bits.value:
+            return None
+        old = gdi32.SelectObject(hdc_mem, hbm)
+        ok = gdi32.BitBlt(hdc_mem, 0, 0, bw, bh, hdc, bx, by, SRCCOPY)
+        gdi32.GdiFlush()
+        data = ctypes.string_at(bits, bw * bh * 4) if ok else None
+        gdi32.SelectObject(hdc_mem, old)
+        return data
+    finally:
+        if hbm: gdi32.DeleteObject(hbm)
+        if hdc_mem: gdi32.DeleteDC(hdc_mem)
+        user32.ReleaseDC(None, hdc)
+
+def get_pixel_colors(points):
+    """
+    Returns the (r, g, b) colors of several screen points.
+    The bounding box of the points is copied once with BitBlt instead of one GetPixel per point.
+    """
+    points = [(int(x), int(y)) for x, y in points]
+    if len(points) <= 1:
+        return [get_pixel_color(x, y) for x, y in points]
+    if not user32 or not gdi32: return [(0, 0, 0)] * len(points)
+
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    bx, by = min(xs), min(ys)
+    bw, bh = max(xs) - bx + 1, max(ys) - by + 1
+    data = _capture_bgra(bx, by, bw, bh)
+    if data is None:
+        return [get_pixel_color(x, y) for x, y in points]
+
+    if np is not None:
+        img = np.frombuffer(data, dtype=np.uint8).reshape(bh, bw, 4)
+        px = img[np.array(ys) - by, np.array(xs) - bx]
+        # BGRA -> RGB
+        return [tuple(c) for c in px[:, 2::-1].tolist()]
+    colors = []
+    for x, y in points:
+        off = ((y - by) * bw + (x - bx)) * 4
+        colors.append((data[off + 2], data[off + 1], data[off]))
+    return colors
@@ -1,8 +1,10 @@
+import re
 import time
 import ctypes
+import atexit
+import threading
 import subprocess
 from ctypes import wintypes
-import platform
 
 # Constants for Windows API
 GWL_STYLE = -16
@@ -57,23 +59,8 @@ WM_SYSCOMMAND = 0x0112
 SC_MONITORPOWER = 0xF170
 HWND_BROADCAST = 0xFFFF
 
-user32 = None
-kernel32 = None
-gdi32 = None
-dxva2 = None
-
-if platform.system() == "Windows":
-    user32 = ctypes.windll.user32
-    kernel32 = ctypes.windll.kernel32
-    gdi32 = ctypes.windll.gdi32
-    try:
-        dxva2 = ctypes.windll.dxva2
-    except Exception:
-        dxva2 = None
-
-class PHYSICAL_MONITOR(ctypes.Structure):
-    _fields_ = [("hPhysicalMonitor", wintypes.HANDLE),
-                ("szPhysicalMonitorDescription", wintypes.WCHAR * 128)]
+# Shared DLL handles with declared prototypes
+from .common import user32, kernel32, gdi32, dxva2, PHYSICAL_MONITOR
 
 # New constants for system features
 WM_INPUTLANGCHANGEREQUEST = 0x0050
@@ -84,6 +71,75 @@ class POINT(ctypes.Structure):
 
 # --- New Features ---
 
+# None = not tried yet; True = worked; False = definitely unavailable (no WMI brightness class,
+# or no PowerShell). Transient failures only pause the fallback for _WMI_RETRY_AFTER seconds.
+_wmi_brightness_ok = None
+_WMI_RETRY_AFTER = 30.0
+_wmi_retry_at = 0.0
+
+_MONITORENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HMONITOR, wintypes.HDC, ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
+
+# Physical monitor handles, enumerated once and reused (DDC/CI probing is slow)
+_phys_monitors = None
+_phys_lock = threading.Lock()
+
+def _enum_physical_monitors():
+    monitors = []
+    def callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
+        count = wintypes.DWORD()
+        if dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR(hMonitor, ctypes.byref(count)):
+            physical_monitors = (PHYSICAL_MONITOR * count.value)()
+            if dxva2.GetPhysicalMonitorsFromHMONITOR(hMonitor, count.value, physical_monitors):
+                monitors.extend(physical_monitors)
+        return True
+
+    user32.EnumDisplayMonitors(None, None, _MONITORENUMPROC(callback), 0)
+    return monitors
+
+def _get_physical_monitors():
+    global _phys_monitors
+    with _phys_lock:
+        if _phys_monitors is None:
+            _phys_monitors = _enum_physical_monitors()
+        return _phys_monitors
+
+def _destroy_monitors():
+    global _phys_monitors
+    with _phys_lock:
+        monitors, _phys_monitors = _phys_monitors, None
+    if monitors:
+        arr = (PHYSICAL_MONITOR * len(monitors))(*monitors)
+        dxva2.DestroyPhysicalMonitors(len(monitors), arr)
+
+def invalidate_monitor_cache():
+    """Release cached monitor handles; they are re-enumerated on next use (e.g. after a display change)."""
+    if dxva2:
+        _destroy_monitors()
+
+atexit.register(invalidate_monitor_cache)
+
+def _with_physical_monitors(fn):
+    """Call fn(monitors) on the cached handles; None when it fails on fresh ones too."""
+    for _ in range(2):
+        result = fn(_get_physical_monitors())
+        if result is not None:
+            return result
+        # The handles may be stale (monitor unplugged, display change): re-enumerate once and retry
+        _destroy_monitors()
+    return None
+
+def _set_monitors_brightness(monitors, level):
+    # Every monitor is set; None only when none of them accepted the level
+    ok = [dxva2.SetMonitorBrightness(m.hPhysicalMonitor, level) for m in monitors]
+    return True if any(ok) else None
+
+def _get_monitors_brightness(monitors):
+    min_b, cur_b, max_b = wintypes.DWORD(), wintypes.DWORD(), wintypes.DWORD()
+    for monitor in monitors:
+        if dxva2.GetMonitorBrightness(monitor.hPhysicalMonitor, ctypes.byref(min_b), ctypes.byref(cur_b), ctypes.byref(max_b)):
+            return int(cur_b.value)
+    return None
+
 def set_brightness(level):
     """Sets monitor brightness (0-100) using both DXVA2 and WMI as fallback"""
     level = max(0, min(100, int(level)))
@@ -92,89 +148,283 @@ def set_brightness(level):
     # Try DXVA2 first (Native)
     if dxva2 and user32:
         try:
-            def callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
-                count = wintypes.DWORD()
-                if dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR(hMonitor, ctypes.byref(count)):
-                    physical_monitors = (PHYSICAL_MONITOR * count.value)()
-                    if dxva2.GetPhysicalMonitorsFromHMONITOR(hMonitor, count.value, physical_monitors):
-                        for i in range(count.value):
-                            dxva2.SetMonitorBrightness(physical_monitors[i].hPhysicalMonitor, level)
-                        dxva2.DestroyPhysicalMonitors(count.value, physical_monitors)
-                return True
-
-            MONITORENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HMONITOR, wintypes.HDC, ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
-            user32.EnumDisplayMonitors(None, None, MONITORENUMPROC(callback), 0)
-            success = True
+            success = bool(_with_physical_monitors(lambda monitors: _set_monitors_brightness(monitors, level)))
         except Exception:
             pass
 
-    # Fallback to WMI (especially for laptops)
+    # Fallback to WMI (especially for laptops); skipped when DXVA2 worked or WMI is known to be missing
+    if not success and _wmi_usable():
+        success = _wmi_set_brightness(level)
+        
+    return success
+
+# --- Persistent PowerShell pipe (startup cost paid once, not per WMI call) ---
+
+_PS_END = '---END---'
+_ps_proc = None
+_ps_lock = threading.Lock()
+
+def _ps_start():
+    global _ps_proc
+    if _ps_proc is None or _ps_proc.poll() is not None:
+        _ps_proc = subprocess.Popen(
+            ["powershell", "-NoProfile", "-NoLogo", "-NonInteractive", "-Command", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+    return _ps_proc
+
+def _ps_kill():
+    global _ps_proc
+    proc, _ps_proc = _ps_proc, None
+    if proc is not None:
+        try:
+            proc.kill()
+        except OSError:
+            pass
+
+atexit.register(_ps_kill)
+
+def _ps_eval(expr, timeout=2):
+    """Run one PowerShell line in the shared process. Returns (ok, stdout text); raises on failure."""
+    with _ps_lock:
+        proc = _ps_start()
+        # A hung command kills the process; the next call starts a fresh one
+        timer = threading.Timer(timeout, _ps_kill)
+        timer.start()
+        try:
+            proc.stdin.write(f"{expr}\nWrite-Output ('{_PS_END}' + $?)\n")
+            proc.stdin.flush()
+            lines = []
+            for line in proc.stdout:
+                line = line.rstrip('\r\n')
+                if line.startswith(_PS_END):
+                    return line.endswith('True'), '\n'.join(lines)
+                lines.append(line)
+        except (OSError, ValueError):
+            _ps_kill()
+            raise
+        finally:
+            timer.cancel()
+    raise OSError("PowerShell process exited")
+
+def _wmi_usable():
+    return _wmi_brightness_ok is not False and time.monotonic() >= _wmi_retry_at
+
+def _wmi_failed(exc=None):
+    """Record a failed WMI call: cache 'unavailable' only when that is certain, otherwise back off."""
+    global _wmi_brightness_ok, _wmi_retry_at
+    if isinstance(exc, FileNotFoundError):
+        # No PowerShell at all
+        _wmi_brightness_ok = False
+        return
     try:
-        cmd = f"powershell (Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightnessMethods).WmiSetBrightness(1,{level})"
-        subprocess.run(cmd, shell=True, capture_output=True, timeout=2)
-        success = True
+        ok, out = _ps_eval("[bool](Get-CimClass -Namespace root/WMI -ClassName WmiMonitorBrightnessMethods -ErrorAction SilentlyContinue)")
+        if ok and out.strip() == 'False':
+            _wmi_brightness_ok = False
+            return
     except Exception:
         pass
-        
-    return success
+    # Transient (PowerShell timeout, monitor asleep, ...): try again later
+    _wmi_retry_at = time.monotonic() + _WMI_RETRY_AFTER
+
+def _wmi_set_brightness(level):
+    global _wmi_brightness_ok
+    try:
+        ok, _ = _ps_eval(f"(Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightnessMethods).WmiSetBrightness(1,{level}) | Out-Null")
+    except Exception as e:
+        _wmi_failed(e)
+        return False
+    if ok:
+        _wmi_brightness_ok = True
+    else:
+        _wmi_failed()
+    return ok
+
+def _wmi_get_brightness():
+    global _wmi_brightness_ok
+    try:
+        ok, out = _ps_eval("(Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightness).CurrentBrightness")
+    except Exception as e:
+        _wmi_failed(e)
+        return -1
+    values = out.split()
+    if ok and values:
+        try:
+            value = int(values[0])
+        except ValueError:
+            value = None
+        if value is not None:
+            _wmi_brightness_ok = True
+            return value
+    _wmi_failed()
+    return -1
 
 def get_brightness():
     """Gets current monitor brightness using DXVA2 or WMI fallback"""
     # Try DXVA2 first
     if dxva2 and user32:
         try:
-            brightness_list = []
-            def callback(hMonitor, hdcMonitor, lprcMonitor, dwData):
-                count = wintypes.DWORD()
-                if dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR(hMonitor, ctypes.byref(count)):
-                    physical_monitors = (PHYSICAL_MONITOR * count.value)()
-                    if dxva2.GetPhysicalMonitorsFromHMONITOR(hMonitor, count.value, physical_monitors):
-                        for i in range(count.value):
-                            min_b, cur_b, max_b = wintypes.DWORD(), wintypes.DWORD(), wintypes.DWORD()
-                            if dxva2.GetMonitorBrightness(physical_monitors[i].hPhysicalMonitor, ctypes.byref(min_b), ctypes.byref(cur_b), ctypes.byref(max_b)):
-                                brightness_list.append(int(cur_b.value))
-                        dxva2.DestroyPhysicalMonitors(count.value, physical_monitors)
-                return True
-
-            MONITORENUMPROC = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HMONITOR, wintypes.HDC, ctypes.POINTER(wintypes.RECT), wintypes.LPARAM)
-            user32.EnumDisplayMonitors(None, None, MONITORENUMPROC(callback), 0)
-            if brightness_list:
-                return brightness_list[0]
+            current = _with_physical_monitors(_get_monitors_brightness)
+            if current is not None:
+                return current
         except Exception:
             pass
 
     # Try WMI fallback
+    if _wmi_usable():
+        return _wmi_get_brightness()
+        
+    return -1
+
+# --- Core Audio (IAudioEndpointVolume) via raw COM vtables ---
+
+CLSCTX_ALL = 0x17
+CLSCTX_INPROC_SERVER = 0x1
+CLSID_MMDeviceEnumerator = "{BCDE0395-E52F-467C-8E3D-C4579291692E}"
+IID_IMMDeviceEnumerator = "{A95664D2-9614-4F35-A746-DE8DB63617E6}"
+IID_IAudioEndpointVolume = "{5CDF2C82-841E-4546-9722-0CF74078229A}"
+HRESULT = ctypes.c_long
+
+class _GUID(ctypes.Structure):
+    _fields_ = [("Data1", wintypes.DWORD), ("Data2", wintypes.WORD),
+               ("Data3", wintypes.WORD), ("Data4", wintypes.BYTE * 8)]
+
+class IUnknown(ctypes.Structure):
+    _fields_ = [("lpVtbl", ctypes.POINTER(ctypes.c_void_p))]
+
+_GUID_RE = re.compile(r"\{?([\dA-F]{8})-([\dA-F]{4})-([\dA-F]{4})-([\dA-F]{2})([\dA-F]{2})-([\dA-F]{12})\}?", re.I)
+
+def str_to_guid(s):
+    m = _GUID_RE.match(s)
+    if not m: return None
+    d = m.groups()
+    g = _GUID()
+    g.Data1, g.Data2, g.Data3 = int(d[0], 16), int(d[1], 16), int(d[2], 16)
+    g.Data4[0], g.Data4[1] = int(d[3], 16), int(d[4], 16)
+    for i in range(6): g.Data4[i+2] = int(d[5][i*2:i*2+2], 16)
+    return g
+
+# Parsed once; passed by reference into COM calls
+_CLSID_MMDE = str_to_guid(CLSID_MMDeviceEnumerator)
+_IID_MMDE = str_to_guid(IID_IMMDeviceEnumerator)
+_IID_AEV = str_to_guid(IID_IAudioEndpointVolume)
+
+def _com_method(iface, index, *argtypes):
+    """Return a callable for vtable slot `index` of a COM interface pointer (c_void_p)."""
+    vtbl = ctypes.cast(iface, ctypes.POINTER(IUnknown)).contents.lpVtbl
+    return ctypes.WINFUNCTYPE(HRESULT, ctypes.c_void_p, *argtypes)(vtbl[index])
+
+def _com_release(iface):
+    if iface:
+        _com_method(iface, 2)(iface)  # IUnknown::Release
+
+def _open_endpoint_volume():
+    """Activate IAudioEndpointVolume on the default render device. COM must be initialized."""
+    ole32 = ctypes.windll.ole32
+    # 1. Create MMDeviceEnumerator
+    enumerator = ctypes.c_void_p()
+    res = ole32.CoCreateInstance(
+        ctypes.byref(_CLSID_MMDE), None, CLSCTX_INPROC_SERVER,
+        ctypes.byref(_IID_MMDE), ctypes.byref(enumerator)
+    )
+    if res != 0: return None
+    device = ctypes.c_void_p()
+    try:
+        # 2. Get Default Audio Endpoint (vtable index 4)
+        get_def = _com_method(enumerator, 4, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_void_p))
+        if get_def(enumerator, 0, 0, ctypes.byref(device)) != 0: return None
+
+        # 3. Activate IAudioEndpointVolume (vtable index 3)
+        activate = _com_method(device, 3, ctypes.POINTER(_GUID), wintypes.DWORD, ctypes.c_void_p,
+                               ctypes.POINTER(ctypes.c_void_p))
+        vol_interface = ctypes.c_void_p()
+        if activate(device, ctypes.byref(_IID_AEV), CLSCTX_ALL, None,
+                    ctypes.byref(vol_interface)) != 0:
+            return None
+        return vol_interface
+    finally:
+        _com_release(device)
+        _com_release(enumerator)
+
+COINIT_MULTITHREADED = 0x0
+
+# Activated IAudioEndpointVolume, reused across get_volume/set_volume calls
+# Per-thread endpoint: a COM interface pointer belongs to the apartment of the thread that created it
+_vol_local = threading.local()
+
+def _cached_endpoint_volume():
+    if getattr(_vol_local, 'vol', None) is None:
+        if not getattr(_vol_local, 'com', False):
+            # MTA where possible; on a thread that is already STA (Qt/UI) this fails with
+            # RPC_E_CHANGED_MODE and COM simply stays in that thread's apartment
+            ctypes.windll.ole32.CoInitializeEx(None, COINIT_MULTITHREADED)
+            _vol_local.com = True
+        _vol_local.vol = _open_endpoint_volume()
+    return _vol_local.vol
+
+def _release_volume_cache():
+    """Release the calling thread's endpoint (it is re-activated on next use)."""
+    vol, _vol_local.vol = getattr(_vol_local, 'vol', None), None
     try:
-        cmd = "powershell (Get-WmiObject -Namespace root/WMI -Class WmiMonitorBrightness).CurrentBrightness"
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=2)
-        if result.stdout.strip():
-            return int(result.stdout.strip())
+        _com_release(vol)
     except Exception:
         pass
-        
-    return -1
+
+atexit.register(_release_volume_cache)
+
+def _with_endpoint_volume(fn):
+    """Call fn(vol_interface) on the cached endpoint; returns None on any failure."""
+    for _ in range(2):
+        vol_interface = _cached_endpoint_volume()
+        if not vol_interface: return None
+        result = fn(vol_interface)
+        if result is not None and result is not False:
+            return result
+        # The default device may have changed: re-activate once and retry
+        _release_volume_cache()
+    return None
+
+def _get_volume_scalar(vol_interface):
+    # GetMasterVolumeLevelScalar (vtable index 9)
+    get_scal = _com_method(vol_interface, 9, ctypes.POINTER(ctypes.c_float))
+    current_vol = ctypes.c_float()
+    if get_scal(vol_interface, ctypes.byref(current_vol)) != 0: return None
+    return current_vol.value
+
+def _set_volume_scalar(vol_interface, value):
+    # SetMasterVolumeLevelScalar (vtable index 7)
+    set_scal = _com_method(vol_interface, 7, ctypes.c_float, ctypes.POINTER(_GUID))
+    return set_scal(vol_interface, value, None) == 0
+
+def _set_volume_keys(level):
+    """Fallback: walk the volume down to 0 and back up with media keys."""
+    # VK_VOLUME_DOWN = 0xAE, VK_VOLUME_UP = 0xAF
+    VK_VOLUME_DOWN = 0xAE
+    VK_VOLUME_UP = 0xAF
+
+    # 1. Reset to 0
+    for _ in range(50):
+        user32.keybd_event(VK_VOLUME_DOWN, 0, 0, 0)
+        user32.keybd_event(VK_VOLUME_DOWN, 0, 2, 0) # KEYEVENTF_KEYUP = 2
+
+    # 2. Set to level
+    steps = int(level / 2)
+    for _ in range(steps):
+        user32.keybd_event(VK_VOLUME_UP, 0, 0, 0)
+        user32.keybd_event(VK_VOLUME_UP, 0, 2, 0)
 
 def set_volume(level):
     """Sets system volume (0-100) using direct sound endpoint API via ctypes"""
     if not user32: return False
     try:
         level = max(0, min(100, int(level)))
-        # VK_VOLUME_MUTE = 0xAD, VK_VOLUME_DOWN = 0xAE, VK_VOLUME_UP = 0xAF
-        VK_VOLUME_MUTE = 0xAD
-        VK_VOLUME_DOWN = 0xAE
-        VK_VOLUME_UP = 0xAF
-        
-        # 1. Reset to 0
-        for _ in range(50):
-            user32.keybd_event(VK_VOLUME_DOWN, 0, 0, 0)
-            user32.keybd_event(VK_VOLUME_DOWN, 0, 2, 0) # KEYEVENTF_KEYUP = 2
-            
-        # 2. Set to level
-        steps = int(level / 2)
-        for _ in range(steps):
-            user32.keybd_event(VK_VOLUME_UP, 0, 0, 0)
-            user32.keybd_event(VK_VOLUME_UP, 0, 2, 0)
-            
+        try:
+            if _with_endpoint_volume(lambda vol: _set_volume_scalar(vol, level / 100.0)):
+                return True
+        except Exception:
+            pass
+        _set_volume_keys(level)
         return True
     except Exception as e:
         print(f"Error setting volume: {e}")
@@ -183,73 +433,9 @@ def set_volume(level):
 def get_volume():
     """Gets current system volume (0-100) using Core Audio API (WASAPI) via ctypes"""
     try:
-        # Core Audio Constants & GUIDs
-        CLSCTX_ALL = 0x17
-        CLSCTX_INPROC_SERVER = 0x1
-        CLSID_MMDeviceEnumerator = "{BCDE0395-E52F-467C-8E3D-C4579291692E}"
-        IID_IMMDeviceEnumerator = "{A95664D2-9614-4F35-A746-DE8DB63617E6}"
-        IID_IAudioEndpointVolume = "{5CDF2C82-841E-4546-9722-0CF74078229A}"
-        HRESULT = ctypes.c_long
-
-        class _GUID(ctypes.Structure):
-            _fields_ = [("Data1", wintypes.DWORD), ("Data2", wintypes.WORD),
-                       ("Data3", wintypes.WORD), ("Data4", wintypes.BYTE * 8)]
-            
-        def str_to_guid(s):
-            import re
-            m = re.match(r"\{?([\dA-F]{8})-([\dA-F]{4})-([\dA-F]{4})-([\dA-F]{2})([\dA-F]{2})-([\dA-F]{12})\}?", s, re.I)
-            if not m: return None
-            d = m.groups()
-            g = _GUID()
-            g.Data1, g.Data2, g.Data3 = int(d[0], 16), int(d[1], 16), int(d[2], 16)
-            g.Data4[0], g.Data4[1] = int(d[3], 16), int(d[4], 16)
-            for i in range(6): g.Data4[i+2] = int(d[5][i*2:i*2+2], 16)
-            return g
-
-        class IUnknown(ctypes.Structure):
-            _fields_ = [("lpVtbl", ctypes.POINTER(ctypes.c_void_p))]
-
-        # Initialize COM
-        ctypes.windll.ole32.CoInitialize(None)
-        
-        try:
-            # 1. Create MMDeviceEnumerator
-            clsid_enum = str_to_guid(CLSID_MMDeviceEnumerator)
-            iid_enum = str_to_guid(IID_IMMDeviceEnumerator)
-            enumerator = ctypes.POINTER(IUnknown)()
-            res = ctypes.windll.ole32.CoCreateInstance(
-                ctypes.byref(clsid_enum), None, CLSCTX_INPROC_SERVER,
-                ctypes.byref(iid_enum), ctypes.byref(enumerator)
-            )
-            if res != 0: return -1
-
-            # 2. Get Default Audio Endpoint (vtable index 4)
-            get_def_proto = ctypes.WINFUNCTYPE(HRESULT, ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_void_p))
-            get_def = get_def_proto(enumerator.contents.lpVtbl[4])
-            device = ctypes.c_void_p()
-            if get_def(enumerator, 0, 0, ctypes.byref(device)) != 0: return -1
-
-            # 3. Activate IAudioEndpointVolume (vtable index 3)
-            class IMMDevice(ctypes.Structure): _fields_ = [("lpVtbl", ctypes.POINTER(ctypes.c_void_p))]
-            device_ptr = ctypes.cast(device, ctypes.POINTER(IMMDevice))
-            activate_proto = ctypes.WINFUNCTYPE(HRESULT, ctypes.c_void_p, ctypes.POINTER(_GUID), wintypes.DWORD, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p))
-            activate = activate_proto(device_ptr.contents.lpVtbl[3])
-            
-            iid_vol = str_to_guid(IID_IAudioEndpointVolume)
-            vol_interface = ctypes.c_void_p()
-            if activate(device, ctypes.byref(iid_vol), CLSCTX_ALL, None, ctypes.byref(vol_interface)) != 0: return -1
-
-            # 4. Get Master Volume Level Scalar (vtable index 9)
-            class IAudioEndpointVolume(ctypes.Structure): _fields_ = [("lpVtbl", ctypes.POINTER(ctypes.c_void_p))]
-            vol_ptr = ctypes.cast(vol_interface, ctypes.POINTER(IAudioEndpointVolume))
-            get_scal_proto = ctypes.WINFUNCTYPE(HRESULT, ctypes.c_void_p, ctypes.POINTER(ctypes.c_float))
-            get_scal = get_scal_proto(vol_ptr.contents.lpVtbl[9])
-            
-            current_vol = ctypes.c_float()
-            if get_scal(vol_interface, ctypes.byref(current_vol)) == 0:
-                return int(current_vol.value * 100)
-        finally:
-            ctypes.windll.ole32.CoUninitialize()
+        value = _with_endpoint_volume(_get_volume_scalar)
+        if value is not None:
+            return int(value * 100)
     except Exception:
         pass
         
@@ -258,52 +444,72 @@ def get_volume():
 def monitor_on():
     """Turns the monitor on"""
     if user32:
-        user32.SendMessageW(HWND_BROADCAST, WM_SYSCOMMAND, SC_MONITORPOWER, -1)
+        user32.SendNotifyMessageW(HWND_BROADCAST, WM_SYSCOMMAND, SC_MONITORPOWER, -1)
         return True
     return False
 
 def monitor_off():
     """Turns the monitor off"""
     if user32:
-        user32.SendMessageW(HWND_BROADCAST, WM_SYSCOMMAND, SC_MONITORPOWER, 2)
+        user32.SendNotifyMessageW(HWND_BROADCAST, WM_SYSCOMMAND, SC_MONITORPOWER, 2)
         return True
     return False
 
-def set_keyboard_layout(lang_id):
-    """
-    Sets keyboard layout for the active window and system.
-    lang_id can be 'en', 'uk', or a hex string like '00000409'
-    """
+def _load_keyboard_layout(lang_id):
+    """Load and activate a layout for this thread; returns the HKL or None."""
     layouts = {
         'en': '00000409',
         'uk': '00000422',
         'ru': '00000419'
     }
     hex_id = layouts.get(lang_id.lower(), lang_id)
-    
+
+    # Load the layout
+    layout = user32.LoadKeyboardLayoutW(hex_id, 1) # 1 is KLF_ACTIVATE
+    if not layout: return None
+
+    # Change for current thread
+    user32.ActivateKeyboardLayout(layout, 0)
+    return layout
+
+def _post_layout_change(layout):
+    """Ask the foreground window to switch to an already loaded HKL."""
+    hwnd = user32.GetForegroundWindow()
+    if hwnd:
+        # We must use PostMessage with WM_INPUTLANGCHANGEREQUEST
+        # Using 0 as wParam and the layout handle as lParam
+        user32.PostMessageW(hwnd, WM_INPUTLANGCHANGEREQUEST, 0, layout)
+
+def set_keyboard_layout(lang_id):
+    """
+    Sets keyboard layout for the active window and system.
+    lang_id can be 'en', 'uk', or a hex string like '00000409'
+    """
     if not user32: return False
     
     try:
-        # Load the layout
-        layout = user32.LoadKeyboardLayoutW(hex_id, 1) # 1 is KLF_ACTIVATE
+        layout = _load_keyboard_layout(lang_id)
         if not layout: return False
         
-        # 1. Change for current thread
-        user32.ActivateKeyboardLayout(layout, 0)
+        # Change for the foreground window
+        _post_layout_change(layout)
         
-        # 2. Change for the foreground window
-        hwnd = user32.GetForegroundWindow()
-        if hwnd:
-            # We must use PostMessage with WM_INPUTLANGCHANGEREQUEST
-            # Using 0 as wParam and the layout handle as lParam
-            user32.PostMessageW(hwnd, WM_INPUTLANGCHANGEREQUEST, 0, layout)
-            
-        # 3. Also try broadcasting to all windows (some apps respond to this)
+        return True
+    except Exception:
+        return False
+
+def set_keyboard_layout_broadcast(lang_id):
+    """
+    Like set_keyboard_layout, but also posts the change request to every top-level window.
+    Opt-in: the broadcast makes every process handle the message and can stall busy systems.
+    """
+    if not user32: return False
+    try:
+        # One HKL for both messages: loading the layout once is enough
+        layout = _load_keyboard_layout(lang_id)
+        if not layout: return False
+        _post_layout_change(layout)
         user32.PostMessageW(HWND_BROADCAST, WM_INPUTLANGCHANGEREQUEST, 0, layout)
-        
-        # 4. Optional: Force layout change via SystemParametersInfo if needed, 
-        # but usually LoadKeyboardLayout with KLF_ACTIVATE is enough for system-wide.
-        
         return True
     except Exception:
         return False
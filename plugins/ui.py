@@ -1,17 +1,49 @@
 import sys
 import threading
+from functools import lru_cache, partial
 from typing import Callable, Optional
 
 try:
     from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QWidget, QVBoxLayout, QPushButton, QLabel, QStyle, QLineEdit, QCheckBox
-    from PySide6.QtGui import QIcon, QAction
+    from PySide6.QtGui import QIcon, QAction, QColor, QPalette
     from PySide6.QtCore import Qt, QTimer
     PYSIDE_AVAILABLE = True
 except ImportError:
     PYSIDE_AVAILABLE = False
 
+if PYSIDE_AVAILABLE:
+    # Enums resolved once, in the fully qualified Qt6 form
+    _SP_COMPUTER = QStyle.StandardPixmap.SP_ComputerIcon
+    _SP_INFO = QStyle.StandardPixmap.SP_MessageBoxInformation
+    _MSG_INFO = QSystemTrayIcon.MessageIcon.Information
+    _LEFT = Qt.MouseButton.LeftButton
+    _WINDOW = Qt.WindowType.Window
+    _TOP_HINT = Qt.WindowType.WindowStaysOnTopHint
+    _FRAMELESS = Qt.WindowType.FramelessWindowHint
+    _WA_TRANS = Qt.WidgetAttribute.WA_TranslucentBackground
+    _BG_ROLES = (QPalette.ColorRole.Window, QPalette.ColorRole.Base, QPalette.ColorRole.Button)
+    _FG_ROLES = (QPalette.ColorRole.WindowText, QPalette.ColorRole.Text, QPalette.ColorRole.ButtonText)
+
 import aml_runtime_access
 
+# How long a notification balloon (and its tray icon) stays up
+_NOTIFICATION_MS = 10000
+
+@lru_cache(maxsize=None)
+def _icon_from_path(path):
+    """QIcon for a file, decoded once per path."""
+    return QIcon(path)
+
+@lru_cache(maxsize=None)
+def _standard_icon(key):
+    """Built-in style icon, looked up once per QStyle key."""
+    return QApplication.instance().style().standardIcon(key)
+
+@lru_cache(maxsize=256)
+def _color(name):
+    """QColor for a colour string; the same few strings recur across set_color calls."""
+    return QColor(name)
+
 class UIManager:
     _instance = None
     
@@ -19,6 +51,12 @@ class UIManager:
         self.app = None
         self.tray_icons = {}
         self.widgets = {}
+        # Ids from _next_id are globally unique, so inputs/checkboxes are keyed flat
+        self._inputs = {}
+        self._checkboxes = {}
+        self._notification_tray = None
+        self._notification_timer = None
+        self._interp = None
         self._next_id = 1
 
     @classmethod
@@ -29,7 +67,42 @@ class UIManager:
 
     @property
     def interpreter(self):
-        return aml_runtime_access.get_interpreter()
+        return self._interp or aml_runtime_access.get_interpreter()
+
+    def bind_interpreter(self, interp):
+        """Pin the interpreter used for callbacks; None goes back to the runtime's current one."""
+        self._interp = interp
+
+    def _bind_callback(self, callback):
+        """Resolve the call style once, at registration; the slot is a C-level partial of _dispatch."""
+        if not callback:
+            return None
+        # In AML, functions are objects with a .call() method usually
+        # but here they might be passed as raw function objects
+        if hasattr(callback, 'call'):
+            return partial(self._dispatch, callback.call, True)
+        return partial(self._dispatch, callback, False)
+
+    def _dispatch(self, target, takes_interpreter, *_):
+        # Shared by every UI signal; extra signal arguments (e.g. checked) are ignored.
+        # The interpreter is read per event, so bind_interpreter() and runtime swaps apply to existing widgets
+        interp = self.interpreter
+        if interp is None:
+            print("Error in UI callback: no AML interpreter is attached")
+            return
+        try:
+            if takes_interpreter:
+                target(interp, [])
+            else:
+                target()
+        except Exception as e:
+            print(f"Error in UI callback: {e}")
+
+    def _new_id(self):
+        # Plain int ids: one counter for every object kind, each kind in its own dict
+        id = self._next_id
+        self._next_id += 1
+        return id
 
     def ensure_app(self):
         if not PYSIDE_AVAILABLE:
@@ -41,47 +114,32 @@ class UIManager:
     def create_tray(self, title: str, icon_path: Optional[str] = None):
         self.ensure_app()
         tray = QSystemTrayIcon(self.app)
-        if icon_path:
-            tray.setIcon(QIcon(icon_path))
-        else:
-            # Default icon if none provided
-            tray.setIcon(self.app.style().standardIcon(QStyle.SP_ComputerIcon))
+        # Default icon if none provided
+        tray.setIcon(_icon_from_path(icon_path) if icon_path else _standard_icon(_SP_COMPUTER))
         
         tray.setToolTip(title)
         menu = QMenu()
         tray.setContextMenu(menu)
         
-        id = f"tray_{self._next_id}"
-        self._next_id += 1
+        id = self._new_id()
         self.tray_icons[id] = {"tray": tray, "menu": menu}
         return id
 
-    def add_menu_item(self, tray_id: str, label: str, callback: Callable):
+    def add_menu_item(self, tray_id: int, label: str, callback: Callable):
         if tray_id not in self.tray_icons:
             return False
         
         menu = self.tray_icons[tray_id]["menu"]
         action = QAction(label, menu)
         
-        def triggered():
-            if self.interpreter and callback:
-                # We need to run this in a way that the interpreter can handle
-                # Since we are in the Qt thread, we can call the function
-                try:
-                    # In AML, functions are objects with a .call() method usually
-                    # but here they might be passed as raw function objects
-                    if hasattr(callback, 'call'):
-                        callback.call(self.interpreter, [])
-                    else:
-                        callback()
-                except Exception as e:
-                    print(f"Error in UI callback: {e}")
-
-        action.triggered.connect(triggered)
+        slot = self._bind_callback(callback)
+        if slot is not None:
+            # We are in the Qt thread, so the function is called directly
+            action.triggered.connect(slot)
         menu.addAction(action)
         return True
 
-    def show_tray(self, tray_id: str):
+    def show_tray(self, tray_id: int):
         if tray_id in self.tray_icons:
             self.tray_icons[tray_id]["tray"].show()
             return True
@@ -94,146 +152,187 @@ class UIManager:
             def __init__(self, parent=None, is_draggable=True):
                 super().__init__(parent)
                 self.is_draggable = is_draggable
-                self.dragging = False
-                self.drag_pos = None
 
             def mousePressEvent(self, event):
-                if self.is_draggable and event.button() == Qt.LeftButton:
-                    self.dragging = True
-                    self.drag_pos = event.globalPos() - self.pos()
-                    event.accept()
-
-            def mouseMoveEvent(self, event):
-                if self.is_draggable and self.dragging and event.buttons() & Qt.LeftButton:
-                    self.move(event.globalPos() - self.drag_pos)
-                    event.accept()
-
-            def mouseReleaseEvent(self, event):
-                self.dragging = False
+                # The window manager runs the whole drag natively, no per-move Python calls
+                if self.is_draggable and event.button() == _LEFT:
+                    handle = self.windowHandle()
+                    if handle is not None and handle.startSystemMove():
+                        event.accept()
+                        return
+                super().mousePressEvent(event)
 
         widget = DraggableWidget(is_draggable=draggable)
         widget.setWindowTitle(title)
         widget.resize(width, height)
         
-        flags = Qt.Window
+        flags = _WINDOW
         if on_top:
-            flags |= Qt.WindowStaysOnTopHint
+            flags |= _TOP_HINT
         if transparent:
-            widget.setAttribute(Qt.WA_TranslucentBackground)
-            flags |= Qt.FramelessWindowHint
+            widget.setAttribute(_WA_TRANS)
+            flags |= _FRAMELESS
             
         widget.setWindowFlags(flags)
         
         layout = QVBoxLayout(widget)
         
-        id = f"widget_{self._next_id}"
-        self._next_id += 1
+        id = self._new_id()
         self.widgets[id] = {"widget": widget, "layout": layout}
         return id
 
-    def add_label(self, widget_id: str, text: str):
+    def add_label(self, widget_id: int, text: str):
         if widget_id not in self.widgets: return False
         label = QLabel(text)
         self.widgets[widget_id]["layout"].addWidget(label)
         return True
 
-    def add_spacer(self, widget_id: str):
+    def add_spacer(self, widget_id: int):
         if widget_id not in self.widgets: return False
         from PySide6.QtWidgets import QSpacerItem, QSizePolicy
         spacer = QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding)
         self.widgets[widget_id]["layout"].addItem(spacer)
         return True
 
-    def add_button(self, widget_id: str, label: str, callback: Callable):
+    def add_button(self, widget_id: int, label: str, callback: Callable):
         if widget_id not in self.widgets: return False
         btn = QPushButton(label)
         
-        def clicked():
-            if self.interpreter and callback:
-                try:
-                    if hasattr(callback, 'call'):
-                        callback.call(self.interpreter, [])
-                    else:
-                        callback()
-                except Exception as e:
-                    print(f"Error in UI callback: {e}")
-                    
-        btn.clicked.connect(clicked)
+        slot = self._bind_callback(callback)
+        if slot is not None:
+            btn.clicked.connect(slot)
         self.widgets[widget_id]["layout"].addWidget(btn)
         return True
 
-    def add_input(self, widget_id: str, placeholder: str = ""):
+    def add_input(self, widget_id: int, placeholder: str = ""):
         if widget_id not in self.widgets: return None
         edit = QLineEdit()
         edit.setPlaceholderText(placeholder)
         self.widgets[widget_id]["layout"].addWidget(edit)
         
-        input_id = f"input_{self._next_id}"
-        self._next_id += 1
-        if "inputs" not in self.widgets[widget_id]:
-            self.widgets[widget_id]["inputs"] = {}
-        self.widgets[widget_id]["inputs"][input_id] = edit
+        input_id = self._new_id()
+        self._inputs[input_id] = edit
         return input_id
 
-    def get_input_text(self, widget_id: str, input_id: str):
-        if widget_id in self.widgets and "inputs" in self.widgets[widget_id]:
-            if input_id in self.widgets[widget_id]["inputs"]:
-                return self.widgets[widget_id]["inputs"][input_id].text()
-        return ""
+    def get_input_text(self, widget_id: int, input_id: int):
+        # widget_id is kept for API compatibility; input ids are unique on their own
+        edit = self._inputs.get(input_id)
+        return edit.text() if edit is not None else ""
 
-    def add_checkbox(self, widget_id: str, label: str, checked: bool = False):
+    def add_checkbox(self, widget_id: int, label: str, checked: bool = False):
         if widget_id not in self.widgets: return None
         cb = QCheckBox(label)
         cb.setChecked(checked)
         self.widgets[widget_id]["layout"].addWidget(cb)
         
-        cb_id = f"cb_{self._next_id}"
-        self._next_id += 1
-        if "checkboxes" not in self.widgets[widget_id]:
-            self.widgets[widget_id]["checkboxes"] = {}
-        self.widgets[widget_id]["checkboxes"][cb_id] = cb
+        cb_id = self._new_id()
+        self._checkboxes[cb_id] = cb
         return cb_id
 
-    def is_checked(self, widget_id: str, cb_id: str):
-        if widget_id in self.widgets and "checkboxes" in self.widgets[widget_id]:
-            if cb_id in self.widgets[widget_id]["checkboxes"]:
-                return self.widgets[widget_id]["checkboxes"][cb_id].isChecked()
-        return False
+    def is_checked(self, widget_id: int, cb_id: int):
+        # widget_id is kept for API compatibility; checkbox ids are unique on their own
+        cb = self._checkboxes.get(cb_id)
+        return cb.isChecked() if cb is not None else False
 
-    def show_widget(self, widget_id: str):
+    # Safety net: a batch left open this long is closed automatically
+    _BATCH_TIMEOUT_MS = 5000
+
+    def begin_batch(self, widget_id: int):
+        """Suspend repaints while a burst of add_* calls builds the widget. Batches nest."""
+        if widget_id not in self.widgets: return False
+        entry = self.widgets[widget_id]
+        depth = entry.get("batch_depth", 0)
+        entry["batch_depth"] = depth + 1
+        if depth == 0:
+            entry["widget"].setUpdatesEnabled(False)
+            gen = entry["batch_gen"] = entry.get("batch_gen", 0) + 1
+            # Only fires if this same batch is still open (end_batch was forgotten)
+            QTimer.singleShot(self._BATCH_TIMEOUT_MS, lambda: self._flush_batch(widget_id, gen))
+        return True
+
+    def end_batch(self, widget_id: int):
+        """Close one begin_batch; the outermost one re-enables repaints and lays the widget out once."""
+        if widget_id not in self.widgets: return False
+        entry = self.widgets[widget_id]
+        depth = entry.get("batch_depth", 0)
+        if depth == 0:
+            # Nothing open: no-op
+            return True
+        entry["batch_depth"] = depth - 1
+        if depth == 1:
+            self._apply_batch(entry)
+        return True
+
+    def _flush_batch(self, widget_id, gen):
+        entry = self.widgets.get(widget_id)
+        if entry and entry.get("batch_depth", 0) and entry.get("batch_gen") == gen:
+            entry["batch_depth"] = 0
+            self._apply_batch(entry)
+
+    def _apply_batch(self, entry):
+        entry["layout"].activate()
+        entry["widget"].setUpdatesEnabled(True)
+        entry["widget"].updateGeometry()
+
+    def show_widget(self, widget_id: int):
         if widget_id in self.widgets:
             self.widgets[widget_id]["widget"].show()
             return True
         return False
 
-    def set_position(self, widget_id: str, x: int, y: int):
+    def set_position(self, widget_id: int, x: int, y: int):
         if widget_id in self.widgets:
             self.widgets[widget_id]["widget"].move(x, y)
             return True
         return False
 
-    def set_size(self, widget_id: str, w: int, h: int):
+    def set_size(self, widget_id: int, w: int, h: int):
         if widget_id in self.widgets:
             self.widgets[widget_id]["widget"].resize(w, h)
             return True
         return False
 
-    def set_style(self, widget_id: str, stylesheet: str):
+    def set_style(self, widget_id: int, stylesheet: str):
         if widget_id in self.widgets:
             self.widgets[widget_id]["widget"].setStyleSheet(stylesheet)
             return True
         return False
 
-    def set_color(self, widget_id: str, bg: str = None, fg: str = None):
+    def set_color(self, widget_id: int, bg: str = None, fg: str = None):
         if widget_id not in self.widgets: return False
-        style = ""
-        if bg: style += f"background-color: {bg}; "
-        if fg: style += f"color: {fg}; "
-        if style:
-            current = self.widgets[widget_id]["widget"].styleSheet()
-            self.widgets[widget_id]["widget"].setStyleSheet(current + f" QWidget {{ {style} }}")
+        if bg or fg:
+            # Palette patch instead of appending to the stylesheet (no CSS reparse per call);
+            # children inherit it like they did the old "QWidget { ... }" rule
+            widget = self.widgets[widget_id]["widget"]
+            pal = widget.palette()
+            if bg:
+                for role in _BG_ROLES:
+                    pal.setColor(role, _color(bg))
+                widget.setAutoFillBackground(True)
+            if fg:
+                for role in _FG_ROLES:
+                    pal.setColor(role, _color(fg))
+            widget.setPalette(pal)
         return True
 
+    def notification_tray(self):
+        """Single tray icon shared by all transient notifications."""
+        self.ensure_app()
+        if self._notification_tray is None:
+            tray = QSystemTrayIcon(self.app)
+            # Hide the icon once the last balloon is gone, or as soon as it is clicked
+            timer = QTimer(self.app)
+            timer.setSingleShot(True)
+            timer.timeout.connect(tray.hide)
+            tray.messageClicked.connect(tray.hide)
+            self._notification_tray = tray
+            self._notification_timer = timer
+        return self._notification_tray
+
+    def hide_notification_later(self, msecs):
+        """(Re)start the timer that hides the shared notification icon."""
+        self._notification_timer.start(msecs)
+
     def run(self):
         self.ensure_app()
         print("[UI] Starting Qt event loop...")
@@ -275,6 +374,12 @@ def add_label(widget_id, text):
 def add_spacer(widget_id):
     return UIManager.get_instance().add_spacer(widget_id)
 
+def begin_batch(widget_id):
+    return UIManager.get_instance().begin_batch(widget_id)
+
+def end_batch(widget_id):
+    return UIManager.get_instance().end_batch(widget_id)
+
 def show_widget(widget_id):
     return UIManager.get_instance().show_widget(widget_id)
 
@@ -300,14 +405,10 @@ def stop():
     return True
 
 def show_notification(title, message, icon_path=None):
-    ui = UIManager.get_instance()
-    ui.ensure_app()
-    tray = QSystemTrayIcon(ui.app)
-    if icon_path:
-        tray.setIcon(QIcon(icon_path))
-    else:
-        tray.setIcon(ui.app.style().standardIcon(QStyle.SP_MessageBoxInformation))
+    manager = UIManager.get_instance()
+    tray = manager.notification_tray()
+    tray.setIcon(_icon_from_path(icon_path) if icon_path else _standard_icon(_SP_INFO))
     tray.show()
-    tray.showMessage(title, message, QSystemTrayIcon.Information)
-    # Give it some time to show before potential GC
-    QTimer.singleShot(10000, tray.hide)
+    # Qt hides the balloon itself after msecs; the icon goes once the newest balloon has
+    tray.showMessage(title, message, _MSG_INFO, _NOTIFICATION_MS)
+    manager.hide_notification_later(_NOTIFICATION_MS)
@@ -5,6 +5,16 @@ import json
 import subprocess
 import datetime
 import glob
+import hashlib
+import queue
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration
 TEST_DIRS = ['tests','tests/comprehensive_suite'] # Start with just tests, maybe add specific examples later
@@ -36,98 +46,296 @@ EXAMPLES_TO_TEST = [
     # Add more robust examples here
     'all_features_test.aml' 
 ]
-STATS_FILE = 'test_stats.json'
+STATS_FILE = 'test_stats.jsonl' # one run record per line, append-only
+LAST_RUN_FILE = 'test_stats_last.json' # latest run only, read by the result cache
+MAX_RUNS = 50
+ROTATE_BYTES = 4 << 20 # history is trimmed to MAX_RUNS once the file grows past this
+TEST_TIMEOUT = 10 # seconds per test
+OUTPUT_LINES = 10000 # captured stdout/stderr lines kept per test
+STORED_OUTPUT = 4096 # chars of output kept in a result record
+# Interpreter sources: editing any of them invalidates every cached result
+INTERPRETER_SOURCES = ['aml.py', 'aml_runtime_access.py', 'aml/*.py', 'plugins/*.py', 'plugins/*/*.py',
+                       'sdk/**/*.aml', 'temaune/**/*.aml']
 
-def load_stats():
-    if os.path.exists(STATS_FILE):
+def load_last_run():
+    if os.path.exists(LAST_RUN_FILE):
         try:
-            with open(STATS_FILE, 'r') as f:
+            with open(LAST_RUN_FILE, 'r') as f:
                 return json.load(f)
-        except:
-            return []
-    return []
+        except (OSError, ValueError):
+            return None
+    return None
+
+def find_aml_files():
+    # One walk over the project instead of an exists() probe per listed file
+    found = set()
+    for root, dirs, files in os.walk('.'):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+        for name in files:
+            if name.endswith('.aml'):
+                found.add(os.path.normpath(os.path.join(root, name)))
+    return found
+
+def interpreter_version():
+    # Hash of the interpreter source manifest (paths + mtimes)
+    h = hashlib.sha1()
+    for pattern in INTERPRETER_SOURCES:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            h.update(f"{path}:{os.path.getmtime(path)}\n".encode())
+    return h.hexdigest()
+
+def file_fingerprint(filepath, cached=None):
+    # (sha1, mtime); the file is only re-hashed when its mtime moved
+    mtime = os.path.getmtime(filepath)
+    if cached and cached[1] == mtime:
+        return cached[0], mtime
+    with open(filepath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest(), mtime
+
+def last_passes(last_run, version):
+    # {path: (sha1, mtime, duration)} of tests that PASSED in the last run of this interpreter version
+    if not last_run or last_run.get("interpreter_version") != version:
+        return {}
+    return {
+        path: (r["sha1"], r["mtime"], r["time"])
+        for path, r in last_run["details"].items()
+        if r["status"] == "PASSED" and "sha1" in r
+    }
+
+def trim_history():
+    # Keep only the last MAX_RUNS records; reads backwards so only the kept tail is loaded
+    with open(STATS_FILE, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= MAX_RUNS:
+            step = min(pos, 1 << 16)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.splitlines(keepends=True)[-MAX_RUNS:]
+    with open(STATS_FILE, 'wb') as f:
+        f.writelines(lines)
+
+def dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+def save_stats(run_record):
+    line = dumps(run_record)
+    with open(STATS_FILE, 'ab') as f:
+        f.write(line + b"\n")
+    with open(LAST_RUN_FILE, 'wb') as f:
+        f.write(line)
+    if os.path.getsize(STATS_FILE) > ROTATE_BYTES:
+        trim_history()
+
+class Worker:
+    """A long-lived `aml.py --serve` process, so interpreter startup is paid once per worker.
+
+    With isolated=True the process is replaced after every test, like one process per test.
+    """
+
+    def __init__(self, isolated=False):
+        self.proc = None
+        self.isolated = isolated
+        self.timed_out = False
+        self.stale = False
+        # Incremented when a run ends, so a late timer cannot kill the next run
+        self.run_id = 0
+        self.lock = threading.Lock()
+        self.spawn()
+
+    def spawn(self):
+        self.proc = subprocess.Popen(
+            # -s: skip user site-packages; -S/-I would hide installed plugin deps and the aml package
+            [sys.executable, '-s', 'aml.py', '--serve'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
 
-def save_stats(stats):
-    # Keep only last 50 runs to avoid huge file
-    if len(stats) > 50:
-        stats = stats[-50:]
-    with open(STATS_FILE, 'w') as f:
-        json.dump(stats, f, indent=2)
+    def kill(self, run_id):
+        with self.lock:
+            if run_id != self.run_id:
+                return
+            self.timed_out = True
+            self.proc.kill()
+
+    def finish_run(self):
+        with self.lock:
+            self.run_id += 1
+
+    def run(self, filepath):
+        # Returns (returncode, stdout, stderr, failed_logic); output is streamed line by line
+        if self.stale or self.proc.poll() is not None:
+            # The previous test was cut short (or the process died idle): replace it first
+            self.restart()
+        self.timed_out = False
+        stdout = collections.deque(maxlen=OUTPUT_LINES)
+        stderr = collections.deque(maxlen=OUTPUT_LINES)
+        timer = threading.Timer(TEST_TIMEOUT, self.kill, args=(self.run_id,))
+        timer.start()
+        try:
+            self.proc.stdin.write(filepath + "\n")
+            self.proc.stdin.flush()
+            for line in self.proc.stdout:
+                msg = json.loads(line)
+                if "out" in msg:
+                    stdout.append(msg["out"])
+                    if msg["out"].startswith("Fail:"):
+                        # Logical failure: stop the script now, respawn on the next run()
+                        self.finish_run()
+                        self.proc.kill()
+                        self.stale = True
+                        return None, "\n".join(stdout), "\n".join(stderr), True
+                elif "err" in msg:
+                    stderr.append(msg["err"])
+                else:
+                    self.finish_run()
+                    self.stale = self.isolated
+                    return msg["returncode"], "\n".join(stdout), "\n".join(stderr), False
+        except (OSError, ValueError):
+            # Broken pipe or a line that is not a protocol message: the stream can't be trusted
+            pass
+        finally:
+            timer.cancel()
+        self.finish_run()
+        # Killed by the timer or crashed: start a fresh worker for the next test
+        timed_out = self.timed_out
+        self.restart()
+        if timed_out:
+            raise subprocess.TimeoutExpired(filepath, TEST_TIMEOUT)
+        raise RuntimeError("aml.py worker exited unexpectedly or sent a malformed reply")
+
+    def restart(self):
+        self.proc.kill()
+        self.proc.wait()
+        self.stale = False
+        self.spawn()
+
+    def close(self):
+        if self.stale:
+            self.proc.kill()
+            self.proc.wait()
+            return
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        self.proc.wait()
+
+# Idle workers, filled by main()
+_workers = queue.Queue()
 
 def run_single_test(filepath):
-    print(f"Running {filepath}...", end='', flush=True)
+    # Runs in a worker thread: returns the result, printing is done by the caller
     start_time = time.time()
+    worker = _workers.get()
     
     try:
-        # Run the AML interpreter as a subprocess
-        # Assuming aml.py is in the root directory
-        result = subprocess.run(
-            [sys.executable, 'aml.py', filepath],
-            capture_output=True,
-            text=True,
-            timeout=10 # 10 seconds timeout per test
-        )
-        print(result.stdout)
+        # Run the file in a persistent AML interpreter process
+        returncode, stdout, stderr, failed_logic = worker.run(filepath)
         duration = time.time() - start_time
         
-        if result.returncode == 0:
-            # Check for "Fail:" in output which might indicate logical failure in test script
-            if "Fail:" in result.stdout:
-                 print(f" \033[91mFAILED (Logic)\033[0m ({duration:.3f}s)")
-                 return {
-                    "status": "FAILED",
-                    "time": duration,
-                    "error": "Logical failure detected in stdout",
-                    "stdout": result.stdout
-                }
-            
-            print(f" \033[92mPASSED\033[0m ({duration:.3f}s)")
+        # "Fail:" in output indicates a logical failure in the test script
+        if failed_logic or (returncode == 0 and "Fail:" in stdout):
             return {
-                "status": "PASSED",
+                "status": "FAILED",
                 "time": duration,
-                "error": None
+                "error": "Logical failure detected in stdout",
+                "stdout": stdout[-STORED_OUTPUT:]
             }
-        else:
-            print(f" \033[91mFAILED (Crash)\033[0m ({duration:.3f}s)")
+        if returncode == 0:
             return {
-                "status": "ERROR",
+                "status": "PASSED",
                 "time": duration,
-                "error": result.stderr if result.stderr else result.stdout
+                "error": None
             }
+        return {
+            "status": "ERROR",
+            "time": duration,
+            "error": (stderr if stderr else stdout)[-STORED_OUTPUT:]
+        }
             
     except subprocess.TimeoutExpired:
-        print(f" \033[91mTIMEOUT\033[0m")
         return {
             "status": "TIMEOUT",
-            "time": 10.0,
+            "time": float(TEST_TIMEOUT),
             "error": "Execution timed out"
         }
     except Exception as e:
-        print(f" \033[91mERROR\033[0m")
         return {
             "status": "INTERNAL_ERROR",
             "time": 0,
             "error": str(e)
         }
+    finally:
+        _workers.put(worker)
+
+STATUS_LABELS = {
+    "PASSED": "\033[92mPASSED\033[0m",
+    "FAILED": "\033[91mFAILED (Logic)\033[0m",
+    "ERROR": "\033[91mFAILED (Crash)\033[0m",
+    "TIMEOUT": "\033[91mTIMEOUT\033[0m",
+    "INTERNAL_ERROR": "\033[91mERROR\033[0m",
+}
+
+STATUS_FMT = "\r[{done}/{total}] {name:40s} {result}"
+
+class Progress:
+    """One status line per finished test; passing tests overwrite each other on a terminal."""
+
+    def __init__(self, total, verbose=False):
+        self.total = total
+        self.done = 0
+        self.verbose = verbose
+        self.tty = sys.stdout.isatty()
+        self.width = 0
+
+    def report(self, filepath, res):
+        self.done += 1
+        label = STATUS_LABELS.get(res['status'], res['status'])
+        if res.get('cached'):
+            label += " (cached)"
+        line = STATUS_FMT.format(done=self.done, total=self.total, name=filepath,
+                                 result=f"{label} ({res['time']:.3f}s)")
+        # Pad over the remains of a longer previous line
+        pad = " " * max(0, self.width - len(line))
+        self.width = len(line)
+        keep = res['status'] != 'PASSED' or not self.tty
+        if keep:
+            line += pad + "\n"
+            self.width = 0
+            if self.verbose and res.get('error'):
+                line += (res.get('stdout') or res['error']).rstrip() + "\n"
+        else:
+            line += pad
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+    def finish(self):
+        if self.width:
+            sys.stdout.write("\n")
 
 def main():
+    use_cache = '--no-cache' not in sys.argv[1:]
+    verbose = '--verbose' in sys.argv[1:]
+    # Fresh interpreter process per test (no state shared between scripts)
+    isolated = '--isolated' in sys.argv[1:]
     print("=== Starting AML Test Suite ===")
     
-    # Gather test files
-    test_files = []
-    
-    # 1. From test dirs
-    for d in TEST_DIRS:
-        if os.path.exists(d):
-            test_files.extend(glob.glob(os.path.join(d, "*.aml")))
-            
-    # 2. Specific examples
-    for ex in EXAMPLES_TO_TEST:
-        if os.path.exists(ex):
-            test_files.append(ex)
-            
-    # Remove duplicates
-    test_files = sorted(list(set(test_files)))
+    # Gather test files: every *.aml directly in a test dir, plus the listed examples that exist
+    candidates = find_aml_files()
+    test_dirs = {os.path.normpath(d) for d in TEST_DIRS}
+    examples = {os.path.normpath(ex) for ex in EXAMPLES_TO_TEST}
+    test_files = sorted(
+        path for path in candidates
+        if os.path.dirname(path) in test_dirs or path in examples
+    )
     
     if not test_files:
         print("No test files found!")
@@ -138,36 +346,74 @@ def main():
     passed_count = 0
     total_time = 0
     
+    wall_start = time.time()
+    progress = Progress(len(test_files), verbose)
+    
+    version = interpreter_version()
+    cache = last_passes(load_last_run(), version) if use_cache else {}
+    
+    # Unchanged files that passed last time reuse their result
+    results = {}
+    to_run = []
+    fingerprints = {}
     for tf in test_files:
-        res = run_single_test(tf)
-        current_run_stats[tf] = res
-        if res['status'] == 'PASSED':
+        cached = cache.get(tf)
+        fingerprints[tf] = file_fingerprint(tf, cached)
+        if cached and cached[0] == fingerprints[tf][0]:
+            results[tf] = {"status": "PASSED", "time": cached[2], "error": None, "cached": True}
+            progress.report(tf, results[tf])
             passed_count += 1
-        total_time += res['time']
+        else:
+            to_run.append(tf)
+    
+    # Tests are independent and subprocess-bound, so threads are enough
+    max_workers = min(os.cpu_count() or 1, len(to_run))
+    workers = [Worker(isolated) for _ in range(max_workers)]
+    for w in workers:
+        _workers.put(w)
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as ex:
+        futures = {ex.submit(run_single_test, tf): tf for tf in to_run}
+        for fut in as_completed(futures):
+            tf = futures[fut]
+            res = fut.result()
+            results[tf] = res
+            progress.report(tf, res)
+            if res['status'] == 'PASSED':
+                passed_count += 1
+            total_time += res['time']
+    
+    progress.finish()
+    for w in workers:
+        w.close()
+    
+    current_run_stats = {}
+    for tf in test_files:
+        sha1, mtime = fingerprints[tf]
+        current_run_stats[tf] = dict(results[tf], sha1=sha1, mtime=mtime)
+    wall_time = time.time() - wall_start
         
     # Summary
     print("\n=== Test Summary ===")
     print(f"Total: {len(test_files)}")
     print(f"Passed: {passed_count}")
     print(f"Failed: {len(test_files) - passed_count}")
-    print(f"Total Duration: {total_time:.3f}s")
+    print(f"Total Duration: {total_time:.3f}s (wall {wall_time:.3f}s)")
     
     # Save stats
-    all_stats = load_stats()
-    
     run_record = {
         "timestamp": datetime.datetime.now().isoformat(),
+        "interpreter_version": version,
         "summary": {
             "total": len(test_files),
             "passed": passed_count,
             "failed": len(test_files) - passed_count,
-            "duration": total_time
+            "duration": total_time,
+            "wall_time": wall_time
         },
         "details": current_run_stats
     }
     
-    all_stats.append(run_record)
-    save_stats(all_stats)
+    save_stats(run_record)
     print(f"Statistics saved to {STATS_FILE}")
 
 if __name__ == "__main__":
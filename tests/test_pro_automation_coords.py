@@ -0,0 +1,35 @@
+import os
+import unittest
+import importlib.util
+
+# common.py is loaded by path: importing the pro_automation package pulls in Windows-only modules
+_COMMON = os.path.join(os.path.dirname(__file__), '..', 'plugins', 'pro_automation', 'common.py')
+_spec = importlib.util.spec_from_file_location('pro_automation_common', _COMMON)
+common = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(common)
+
+
+def to_pixel(n, origin, size):
+    # How Windows maps a normalized absolute coordinate back to a pixel
+    return origin + ((n * size) >> 16)
+
+
+class NormalizeAbsoluteTest(unittest.TestCase):
+    def test_round_trip_lands_on_every_pixel(self):
+        for origin, size in ((0, 1920), (0, 1080), (-1920, 3840), (-1080, 2160), (0, 7), (1280, 2560)):
+            for v in range(origin, origin + size):
+                n = common.normalize_absolute(v, origin, size)
+                self.assertTrue(0 <= n <= 65535)
+                self.assertEqual(to_pixel(n, origin, size), v, (origin, size, v))
+
+    def test_edges(self):
+        self.assertEqual(to_pixel(common.normalize_absolute(0, 0, 1920), 0, 1920), 0)
+        self.assertEqual(to_pixel(common.normalize_absolute(1919, 0, 1920), 0, 1920), 1919)
+
+    def test_out_of_range_is_clamped(self):
+        self.assertEqual(common.normalize_absolute(-5000, -1920, 3840), 0)
+        self.assertEqual(common.normalize_absolute(10000, -1920, 3840), 65535)
+
+
+if __name__ == '__main__':
+    unittest.main()